@@ -10,92 +10,58 @@ Usage: uv run $PLUGIN_ROOT/plan.py <subcommand> [args]
 """
 
 import argparse
+import itertools
 import json
+import os
+import re
 import sqlite3
+import string
+import subprocess
 import sys
+import time
+import tomllib
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
 
 # Plugin root directory (for generating portable paths in prompts)
 PLUGIN_ROOT = Path(__file__).parent
 
-# Task schema documentation injected into phases with use_tasks=true
-# Keep in sync with schemas/tasks-schema.json
-TASK_SCHEMA = """
-## Task Schema
-
-Create `tasks.json` as a JSON array of task objects:
-
-| Field | Required | Description |
-|-------|----------|-------------|
-| `id` | Yes | Unique identifier (kebab-case) |
-| `description` | Yes | What the task accomplishes |
-| `status` | Yes | Always `"todo"` when creating |
-| `type` | No | Task type: `cache-reference`, `prototype` |
-| `steps` | No | Array of concrete steps |
-| `parents` | No | Task IDs that must complete first (empty `[]` if none) |
-| `context_artifacts` | No | Artifact names to include (e.g., `["request", "design"]`) |
-| `subagent` | No | Agent type: `general-purpose` (default), `gemini-reviewer`, `codex-reviewer` |
-| `subagent_prompt` | No | Additional context (e.g., `"very thorough analysis"`) |
-| `model` | No | `sonnet` (default), `haiku`, `opus` |
-| `question` | No | For prototype tasks: the question being answered |
-| `hypothesis` | No | For prototype tasks: expected outcome |
-| `inject_project_context` | No | Include project CLAUDE.md in task prompt (default: false) |
-| `locks` | No | Lock names for exclusive access (files, tools, or resources) |
-| `cache_id` | No | Cache entry ID for cache-reference type tasks |
-
-### Example
-```json
-[
-  {
-    "id": "research-patterns",
-    "description": "Research existing patterns in codebase",
-    "subagent": "general-purpose",
-    "subagent_prompt": "very thorough analysis",
-    "model": "haiku",
-    "parents": [],
-    "steps": ["Find relevant files", "Document patterns found"],
-    "status": "todo"
-  },
-  {
-    "id": "implement-feature",
-    "description": "Implement the feature",
-    "parents": ["research-patterns"],
-    "locks": ["cargo"],
-    "steps": ["Create module", "Add tests"],
-    "status": "todo"
-  }
-]
-```
+# Proposal statuses considered live when injecting lessons into prompts
+_ACTIVE_STATUSES = frozenset({"pending", "accepted"})
 
-### Parallelization
-Tasks without shared parents can run in parallel, but add parent dependencies when:
-- Tasks modify files in the same directory
-- Tasks edit the same config files
-- Tasks have logical ordering requirements
-
-Use `locks` to serialize tasks needing exclusive access to the same resource:
-- `"cargo"` - Rust builds (cargo build/check/test)
-- `"browser"` - Browser automation tools
-- `"src/config.rs"` - Specific files edited by multiple tasks
-""".strip()
+# Task schema documentation injected into phases with use_tasks=true.
+# The text lives in schemas/task-schema.md (keep in sync with
+# schemas/tasks-schema.json) and is loaded lazily so subcommands that never
+# emit prompts skip the read.
+@cache
+def task_schema() -> str:
+    """Load the task schema documentation markdown."""
+    return (PLUGIN_ROOT / "schemas" / "task-schema.md").read_text().strip()
 
 
+@cache
 def get_project_dir() -> Path:
-    """Get project directory (git root or cwd).
+    """Get project directory (git root or cwd), memoized per process.
 
     Uses git root if in a git repo, otherwise falls back to cwd.
     Never walks up looking for .claude/ to avoid accidentally using ~/.claude/.
     """
-    import subprocess
+    # Probe for .git directly before shelling out — for the common case this
+    # resolves with a couple of stat calls instead of a fork+exec of git.
+    cwd = Path.cwd()
+    for candidate in (cwd, *cwd.parents):
+        if (candidate / ".git").exists():
+            return candidate
 
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
             capture_output=True,
             text=True,
-            cwd=Path.cwd(),
+            cwd=cwd,
         )
         if result.returncode == 0:
             return Path(result.stdout.strip())
@@ -103,15 +69,30 @@ def get_project_dir() -> Path:
         pass
 
     # Fallback to cwd if not in a git repo
-    return Path.cwd()
+    return cwd
+
+
+def _read_bytes_fast(path: Path) -> bytes:
+    """Read a small file's bytes with a single open/fstat/read/close.
+
+    Path.read_text() stats, opens, and routes through buffered text I/O; for
+    the many small JSON/text files the CLI touches per invocation this skips
+    the redundant stat syscall and the decode buffering.
+    """
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
 
 
 def get_active_plan(project_dir: Path) -> str | None:
     """Get active plan name from .claude/jons-plan/active-plan file."""
     active_plan_file = project_dir / ".claude" / "jons-plan" / "active-plan"
-    if active_plan_file.exists():
-        return active_plan_file.read_text().strip()
-    return None
+    try:
+        return _read_bytes_fast(active_plan_file).decode().strip()
+    except OSError:
+        return None
 
 
 def get_active_plan_dir(project_dir: Path) -> Path | None:
@@ -131,26 +112,77 @@ def get_tasks_file(plan_dir: Path) -> Path | None:
         Path to tasks.json if in a phase, None otherwise
     """
     state_file = plan_dir / "state.json"
-    if state_file.exists():
-        try:
-            state = json.loads(state_file.read_text())
-            phase_dir = state.get("current_phase_dir")
-            if phase_dir:
-                return plan_dir / phase_dir / "tasks.json"
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        state = json.loads(_read_bytes_fast(state_file))
+        phase_dir = state.get("current_phase_dir")
+        if phase_dir:
+            # Single Path construction instead of chained / operators, which
+            # allocate an intermediate PurePath per segment
+            return Path(f"{plan_dir}{os.sep}{phase_dir}{os.sep}tasks.json")
+    except (json.JSONDecodeError, OSError):
+        pass
     return None
 
 
+@lru_cache(maxsize=8)
+def _parse_tasks_file(path_str: str, mtime_ns: int, size: int) -> list[dict]:
+    """Parse a tasks.json, cached on (path, mtime, size).
+
+    Commands that load tasks several times in one process (status checks,
+    prompt assembly) skip re-parsing when the file is unchanged. Every
+    write path bumps the mtime and also clears this cache, so mutating the
+    returned list just before saving is safe.
+    """
+    data = json.loads(_read_bytes_fast(Path(path_str)))
+    if isinstance(data, list):
+        return data
+    return data.get("tasks", [])
+
+
+@lru_cache(maxsize=8)
+def _parse_state_file(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a state.json, cached on (path, mtime, size).
+
+    Commands re-instantiate StateManager freely (helpers like loop-phase end
+    up loading state several times per process); an unchanged file parses
+    once. StateManager.save clears this cache after its atomic rename, so
+    the common mutate-then-save flow stays coherent.
+    """
+    return json.loads(_read_bytes_fast(Path(path_str)))
+
+
+@lru_cache(maxsize=8)
+def _parse_workflow_file(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a workflow.toml, cached on (path, mtime, size).
+
+    The workflow is read-only for almost every command, and TOML parsing is
+    the most expensive single parse the CLI does. Workflow expansion rewrites
+    the file (bumping the mtime) and calls invalidate_cache, which also
+    clears this cache.
+    """
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
 def get_tasks(plan_dir: Path) -> list[dict]:
     """Load tasks from current phase's tasks.json."""
     tasks_file = get_tasks_file(plan_dir)
-    if tasks_file and tasks_file.exists():
-        data = json.loads(tasks_file.read_text())
-        if isinstance(data, list):
-            return data
-        return data.get("tasks", [])
-    return []
+    if not tasks_file:
+        return []
+    try:
+        st = os.stat(tasks_file)
+    except OSError:
+        return []
+    return _parse_tasks_file(str(tasks_file), st.st_mtime_ns, st.st_size)
+
+
+def get_tasks_indexed(plan_dir: Path) -> tuple[list[dict], dict[str, dict]]:
+    """Load tasks plus an id -> task index built in the same pass.
+
+    Commands that look tasks up by id use the dict instead of a linear scan.
+    """
+    tasks = get_tasks(plan_dir)
+    return tasks, {t["id"]: t for t in tasks if "id" in t}
 
 
 def save_tasks(plan_dir: Path, tasks: list[dict]) -> Path | None:
@@ -163,41 +195,141 @@ def save_tasks(plan_dir: Path, tasks: list[dict]) -> Path | None:
         return None
 
     if tasks_file.exists():
-        data = json.loads(tasks_file.read_text())
+        data = json.loads(_read_bytes_fast(tasks_file))
         if isinstance(data, list):
-            tasks_file.write_text(json.dumps(tasks, indent=2) + "\n")
+            _dump_json(tasks_file, tasks)
         else:
             data["tasks"] = tasks
-            tasks_file.write_text(json.dumps(data, indent=2) + "\n")
+            _dump_json(tasks_file, data)
     else:
         tasks_file.parent.mkdir(parents=True, exist_ok=True)
-        tasks_file.write_text(json.dumps(tasks, indent=2) + "\n")
+        _dump_json(tasks_file, tasks)
+    _parse_tasks_file.cache_clear()
     return tasks_file
 
 
+def update_task_status(plan_dir: Path, task_id: str, new_status: str) -> Path | None:
+    """Update a single task's status without rewriting the whole file when possible.
+
+    Status flips are by far the most common tasks.json mutation. When the new
+    value has the same byte length as the old one (e.g. "todo" -> "done"),
+    patch the serialized value in place instead of re-serializing and
+    rewriting the entire file. Falls back to a full save_tasks otherwise.
+
+    Returns the path to the tasks file that was written, or None if no
+    current phase or the task was not found.
+    """
+    tasks_file = get_tasks_file(plan_dir)
+    if not tasks_file or not tasks_file.exists():
+        return None
+
+    raw = tasks_file.read_bytes()
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    tasks = data if isinstance(data, list) else data.get("tasks", [])
+
+    task = next((t for t in tasks if t.get("id") == task_id), None)
+    if task is None:
+        return None
+    old_status = task.get("status")
+    if old_status == new_status:
+        return tasks_file
+
+    if isinstance(old_status, str) and len(old_status) == len(new_status):
+        # Locate this task's object in the serialized bytes. save_tasks writes
+        # a top-level list with indent=2, so each task object spans
+        # "\n  {" ... "\n  }"; bound the search to that window so we never
+        # patch another task's status.
+        id_marker = f'"id": {json.dumps(task_id)}'.encode()
+        idx = raw.find(id_marker)
+        if idx != -1 and raw.find(id_marker, idx + 1) == -1:
+            obj_start = raw.rfind(b"\n  {", 0, idx)
+            obj_end = raw.find(b"\n  }", idx)
+            if obj_start != -1 and obj_end != -1:
+                status_marker = f'"status": {json.dumps(old_status)}'.encode()
+                pos = raw.find(status_marker, obj_start, obj_end)
+                if pos != -1 and raw.find(status_marker, pos + 1, obj_end) == -1:
+                    value_offset = pos + len(b'"status": "')
+                    with open(tasks_file, "r+b") as f:
+                        f.seek(value_offset)
+                        f.write(new_status.encode())
+                    _parse_tasks_file.cache_clear()
+                    return tasks_file
+
+    # Fall back to the full rewrite
+    task["status"] = new_status
+    return save_tasks(plan_dir, tasks)
+
+
 def get_task_output_dir(plan_dir: Path, task_id: str) -> Path | None:
     """Get the path to a task's output directory in current phase.
 
     Returns None if no current phase is set.
     """
     state_file = plan_dir / "state.json"
-    if state_file.exists():
-        try:
-            state = json.loads(state_file.read_text())
-            phase_dir = state.get("current_phase_dir")
-            if phase_dir:
-                return plan_dir / phase_dir / "tasks" / task_id
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        state = json.loads(_read_bytes_fast(state_file))
+        phase_dir = state.get("current_phase_dir")
+        if phase_dir:
+            return Path(
+                f"{plan_dir}{os.sep}{phase_dir}{os.sep}tasks{os.sep}{task_id}"
+            )
+    except (json.JSONDecodeError, OSError):
+        pass
     return None
 
 
+# Cached [second, formatted string] pair so bursts of log entries within the
+# same second skip the strftime call.
+_LAST_TS: list = [0, ""]
+
+
+def _progress_timestamp() -> str:
+    """Format the current time as 'YYYY-MM-DD HH:MM:SS', cached per second."""
+    sec = int(time.time())
+    if sec != _LAST_TS[0]:
+        _LAST_TS[0] = sec
+        t = time.localtime(sec)
+        # Direct f-string formatting skips strftime's locale-aware C path
+        _LAST_TS[1] = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f" {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        )
+    return _LAST_TS[1]
+
+
+def _append_line(path: Path, line: str) -> None:
+    """Append one line with a single open/write/close.
+
+    O_APPEND writes are atomic on POSIX, so concurrent loggers interleave
+    whole lines without locking; skipping buffered text I/O saves the
+    wrapper setup for what is always a one-shot write per invocation.
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
+
+
+def _dump_json(path: Path, obj) -> None:
+    """Serialize JSON straight into a buffered file handle.
+
+    json.dump streams encoder chunks into the writer, so the document is
+    never doubled in memory the way write_text(json.dumps(...)) doubles it;
+    the 64KB buffer coalesces those chunks into few write syscalls.
+    """
+    with open(path, "w", encoding="utf-8", buffering=65536) as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
 def log_progress(plan_dir: Path, message: str) -> None:
     """Append entry to progress log."""
     progress_file = plan_dir / "claude-progress.txt"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(progress_file, "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    _append_line(progress_file, f"[{_progress_timestamp()}] {message}\n")
 
 
 def log_task_progress(plan_dir: Path, task_id: str, message: str) -> None:
@@ -208,9 +340,7 @@ def log_task_progress(plan_dir: Path, task_id: str, message: str) -> None:
         task_dir = plan_dir / "tasks" / task_id
     task_dir.mkdir(parents=True, exist_ok=True)
     progress_file = task_dir / "progress.txt"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(progress_file, "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    _append_line(progress_file, f"[{_progress_timestamp()}] {message}\n")
 
 
 def log_phase_progress(plan_dir: Path, message: str) -> None:
@@ -223,9 +353,7 @@ def log_phase_progress(plan_dir: Path, message: str) -> None:
     phase_dir = plan_dir / current_dir
     phase_dir.mkdir(parents=True, exist_ok=True)
     progress_file = phase_dir / "progress.txt"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(progress_file, "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    _append_line(progress_file, f"[{_progress_timestamp()}] {message}\n")
 
 
 def build_reentry_context(
@@ -234,12 +362,10 @@ def build_reentry_context(
 ) -> str:
     """Build detailed re-entry analysis content from a concise reason string."""
     artifacts = previous_entry.get("artifacts", {})
-    artifact_lines = []
-    if artifacts:
-        for name, path in artifacts.items():
-            artifact_lines.append(f"- {name}: {path}")
-    else:
-        artifact_lines.append("- (none recorded)")
+    artifact_lines = [f"- {name}: {path}" for name, path in artifacts.items()] or [
+        "- (none recorded)"
+    ]
+    artifacts_block = "\n".join(artifact_lines)
 
     content = f"""## Why Previous Attempt Failed
 {reason}
@@ -258,7 +384,7 @@ def build_reentry_context(
 - Prior directory: {previous_entry.get("dir", "unknown")}
 - Prior outcome: {previous_entry.get("outcome", "unknown")}
 - Prior artifacts:
-{chr(10).join(artifact_lines)}
+{artifacts_block}
 """
     return content.strip()
 
@@ -275,14 +401,29 @@ class StateManager:
 
     def load(self) -> dict:
         """Load state, return default if missing or corrupted."""
-        if not self.state_file.exists():
-            return self._default_state()
         try:
-            state = json.loads(self.state_file.read_text())
-            return state
+            st = os.stat(self.state_file)
+            return _parse_state_file(
+                str(self.state_file), st.st_mtime_ns, st.st_size
+            )
         except (json.JSONDecodeError, OSError):
             return self._default_state()
 
+    @staticmethod
+    def find_history_entry(state: dict, entry: int) -> dict | None:
+        """Find a phase_history record by entry number.
+
+        Entries are appended in order with 1-based monotonic numbers, so
+        direct indexing resolves the common case in O(1); a reverse scan
+        covers histories that were hand-edited or truncated.
+        """
+        history = state.get("phase_history", [])
+        if 0 < entry <= len(history):
+            candidate = history[entry - 1]
+            if candidate.get("entry") == entry:
+                return candidate
+        return next((e for e in reversed(history) if e.get("entry") == entry), None)
+
     def save(self, state: dict) -> None:
         """Atomically write state.json using temp-file + rename."""
         temp_file = self.state_file.with_suffix(".json.tmp")
@@ -290,14 +431,13 @@ class StateManager:
             content = json.dumps(state, indent=2) + "\n"
             temp_file.write_text(content)
             # Force to disk before rename
-            import os
-
             with open(temp_file, "r") as f:
                 os.fsync(f.fileno())
             # Atomic rename (POSIX); on Windows, may need to remove target first
             if sys.platform == "win32" and self.state_file.exists():
                 self.state_file.unlink()
             temp_file.rename(self.state_file)
+            _parse_state_file.cache_clear()
         except Exception:
             # Clean up temp file on failure
             if temp_file.exists():
@@ -310,13 +450,14 @@ class StateManager:
         """Transition to new phase, update history, return updated state."""
         state = self.load()
         entry = state.get("current_phase_entry", 0) + 1
+        now_iso = datetime.now().isoformat()
 
         # Close current phase in history if exists
         old_phase_id = state.get("current_phase")
         if state.get("phase_history"):
             current_entry = state["phase_history"][-1]
             if "exited" not in current_entry:
-                current_entry["exited"] = datetime.now().isoformat()
+                current_entry["exited"] = now_iso
                 current_entry["outcome"] = "completed"
 
         # Reset retry counter for old phase if transitioning to a different phase
@@ -329,27 +470,31 @@ class StateManager:
         state["current_phase"] = phase_id
         state["current_phase_dir"] = phase_dir
         state["current_phase_entry"] = entry
+        # Fresh phase starts with no artifacts; record_artifact maintains
+        # this mirror so readers never have to consult phase_history
+        state["current_phase_artifacts"] = {}
 
         # Add new phase entry to history
         new_entry = {
             "entry": entry,
             "phase": phase_id,
             "dir": phase_dir,
-            "entered": datetime.now().isoformat(),
+            "entered": now_iso,
         }
         if reason:
             new_entry["reason"] = reason
 
-        # Check if this is a re-entry (phase visited before)
-        prev_entries = [
-            e for e in state.get("phase_history", []) if e["phase"] == phase_id
-        ]
-        if prev_entries:
-            new_entry["context_from"] = prev_entries[-1]["entry"]
+        # Check if this is a re-entry (phase visited before); only the most
+        # recent prior entry matters, so scan backwards and stop at the first
+        # match instead of materializing every previous visit.
+        history = state.setdefault("phase_history", [])
+        prev_entry = next(
+            (e for e in reversed(history) if e["phase"] == phase_id), None
+        )
+        if prev_entry is not None:
+            new_entry["context_from"] = prev_entry["entry"]
 
-        if "phase_history" not in state:
-            state["phase_history"] = []
-        state["phase_history"].append(new_entry)
+        history.append(new_entry)
 
         self.save(state)
         return state
@@ -362,8 +507,27 @@ class StateManager:
             if "artifacts" not in current:
                 current["artifacts"] = {}
             current["artifacts"][filename] = path
+            # Mirror onto state so the current phase's artifacts are an
+            # O(1) lookup instead of a phase_history search
+            state["current_phase_artifacts"] = current["artifacts"]
             self.save(state)
 
+    @staticmethod
+    def current_phase_artifacts(state: dict) -> dict:
+        """Artifacts recorded by the current phase, as {filename: rel_path}.
+
+        Reads the mirror maintained by record_artifact/update_phase; falls
+        back to the current phase_history record for state files written
+        before the mirror existed.
+        """
+        artifacts = state.get("current_phase_artifacts")
+        if artifacts is not None:
+            return artifacts
+        entry = StateManager.find_history_entry(
+            state, state.get("current_phase_entry", 0)
+        )
+        return (entry or {}).get("artifacts", {})
+
     def record_plan_artifact(self, name: str, path: str) -> None:
         """Register a plan-level artifact (not tied to any phase)."""
         state = self.load()
@@ -421,6 +585,7 @@ class StateManager:
         to_phase: str,
         reason: str,
         from_entry: int,
+        session_mode: str | None = None,
     ) -> None:
         """Set pending approval for a transition.
 
@@ -429,6 +594,8 @@ class StateManager:
             to_phase: Target phase ID
             reason: Why transition is needed
             from_entry: Current phase entry number (for staleness check)
+            session_mode: If given, set the session mode in the same write
+                instead of a separate load/save round-trip
         """
         state = self.load()
         state["pending_approval"] = {
@@ -438,6 +605,8 @@ class StateManager:
             "reason": reason,
             "proposed_at": datetime.now().isoformat(),
         }
+        if session_mode is not None:
+            state["session_mode"] = session_mode
         self.save(state)
 
     def clear_pending_approval(self) -> None:
@@ -511,11 +680,17 @@ class DeadEndRegistry:
 
     def load(self) -> list[dict]:
         """Load dead ends, return empty list if missing or corrupted."""
-        if not self.dead_ends_file.exists():
+        try:
+            data = _read_bytes_fast(self.dead_ends_file)
+        except OSError:
+            return []
+        # An empty registry serializes as "[]" plus a trailing newline
+        # (see save); skip the parse
+        if data.strip() in (b"", b"[]"):
             return []
         try:
-            return json.loads(self.dead_ends_file.read_text())
-        except (json.JSONDecodeError, OSError):
+            return json.loads(data)
+        except json.JSONDecodeError:
             return []
 
     def save(self, dead_ends: list[dict]) -> None:
@@ -524,8 +699,6 @@ class DeadEndRegistry:
         try:
             content = json.dumps(dead_ends, indent=2) + "\n"
             temp_file.write_text(content)
-            import os
-
             with open(temp_file, "r") as f:
                 os.fsync(f.fileno())
             if sys.platform == "win32" and self.dead_ends_file.exists():
@@ -547,10 +720,9 @@ class DeadEndRegistry:
         """Add new dead end, return generated ID."""
         dead_ends = self.load()
 
-        # Generate timestamp-based ID (guaranteed unique)
-        import time
-
-        dead_end_id = f"de-{int(time.time() * 1000)}"
+        # Wall-clock nanosecond ID: dead-ends.json outlives the process, so
+        # the ID must stay unique and ordered across runs and reboots
+        dead_end_id = f"de-{time.time_ns()}"
 
         dead_ends.append(
             {
@@ -600,6 +772,32 @@ class DeadEndRegistry:
         return "\n".join(lines)
 
 
+# Valid key sets for workflow.toml schema validation (see validate_schema).
+# Module-level frozensets so validation never rebuilds them per call.
+_VALID_TOP_LEVEL_KEYS = frozenset({"workflow", "phases"})
+_VALID_WORKFLOW_KEYS = frozenset({"name", "description"})
+_VALID_PHASE_KEYS = frozenset({
+    "id", "prompt", "prompt_files", "suggested_next", "terminal", "use_tasks",
+    "requires_user_input", "max_retries", "max_iterations",
+    "supports_proposals",  # deprecated: kept for compat with existing plans
+    "supports_prototypes", "supports_cache_reference",
+    "expand_prompt", "required_artifacts", "context_artifacts",
+    "required_tasks", "required_json_artifacts",
+    "planning_panel",
+})
+_VALID_TRANSITION_KEYS = frozenset({"phase", "instruction", "requires_approval", "approval_prompt"})
+_VALID_REQUIRED_TASK_KEYS = frozenset({
+    "id", "description", "prompt_file", "subagent", "subagent_prompt",
+    "model", "parents", "steps", "context_artifacts", "type",
+    "question", "hypothesis", "inject_project_context", "locks",
+    "executor", "inject_phase_prompt",
+})
+_VALID_JSON_ARTIFACT_KEYS = frozenset({"name", "schema"})
+# Pre-sorted renderings for error messages
+_SORTED_VALID_PHASE_KEYS = sorted(_VALID_PHASE_KEYS)
+_SORTED_VALID_REQUIRED_TASK_KEYS = sorted(_VALID_REQUIRED_TASK_KEYS)
+
+
 class WorkflowManager:
     """Handles workflow.toml queries for workflow plans."""
 
@@ -607,6 +805,11 @@ class WorkflowManager:
         self.plan_dir = plan_dir
         self.workflow_file = plan_dir / "workflow.toml"
         self._workflow: dict | None = None
+        self._phase_by_id: dict[str, dict] = {}
+        self._phase_ids: frozenset[str] = frozenset()
+        self._suggested_ids: dict[str, list[str]] = {}
+        self._suggested_full: dict[str, list[dict]] = {}
+        self._has_expandable_phases = False
 
     def exists(self) -> bool:
         """Check if workflow.toml exists."""
@@ -615,21 +818,43 @@ class WorkflowManager:
     def load(self) -> dict:
         """Load workflow.toml with lazy loading and caching."""
         if self._workflow is None:
-            import tomllib
-
-            with open(self.workflow_file, "rb") as f:
-                self._workflow = tomllib.load(f)
+            st = os.stat(self.workflow_file)
+            self._workflow = _parse_workflow_file(
+                str(self.workflow_file), st.st_mtime_ns, st.st_size
+            )
+            # Index phases by ID so lookups and reference validation are O(1)
+            self._phase_by_id = {
+                p["id"]: p
+                for p in self._workflow.get("phases", [])
+                if isinstance(p, dict) and "id" in p
+            }
+            self._phase_ids = frozenset(self._phase_by_id)
+            # Normalize suggested_next to uniform dicts (and plain phase-ID
+            # lists) up front so transition helpers skip the per-call
+            # isinstance dispatch
+            self._suggested_full = {
+                pid: self._normalize_full(p.get("suggested_next", []))
+                for pid, p in self._phase_by_id.items()
+            }
+            self._suggested_ids = {
+                pid: [item["phase"] for item in items if item["phase"]]
+                for pid, items in self._suggested_full.items()
+            }
+            self._has_expandable_phases = any(
+                "expand_prompt" in p
+                for p in self._workflow.get("phases", [])
+                if isinstance(p, dict)
+            ) or any(
+                "__expand__" in ids for ids in self._suggested_ids.values()
+            )
         return self._workflow
 
     def get_phase(self, phase_id: str) -> dict | None:
         """Find phase by ID."""
         if not self.exists():
             return None
-        workflow = self.load()
-        for phase in workflow.get("phases", []):
-            if phase.get("id") == phase_id:
-                return phase
-        return None
+        self.load()
+        return self._phase_by_id.get(phase_id)
 
     def get_all_phases(self) -> list[dict]:
         """Get all phases in the workflow."""
@@ -640,40 +865,25 @@ class WorkflowManager:
 
     def get_suggested_next(self, phase_id: str) -> list[str]:
         """Get suggested next phases for a given phase (phase IDs only)."""
-        return self.normalize_suggested_next(
-            self.get_phase(phase_id).get("suggested_next", []) if self.get_phase(phase_id) else []
-        )
+        if not self.exists():
+            return []
+        self.load()
+        return self._suggested_ids.get(phase_id, [])
 
-    def normalize_suggested_next(self, suggested_next: list) -> list[str]:
-        """Extract phase IDs from mixed string/object format.
+    @staticmethod
+    def _normalize_full(suggested_next: list) -> list[dict]:
+        """Normalize mixed string/object suggested_next to uniform dicts.
 
-        Handles both:
-        - "phase-id" (string)
-        - {"phase": "phase-id", "requires_approval": true} (object)
+        Every entry gets 'phase', 'requires_approval', and 'approval_prompt'
+        keys so consumers never need isinstance dispatch; 'instruction' is
+        carried through when present.
         """
         result = []
         for item in suggested_next:
             if isinstance(item, str):
-                result.append(item)
-            elif isinstance(item, dict):
-                phase_id = item.get("phase", "")
-                if phase_id:
-                    result.append(phase_id)
-        return result
-
-    def get_suggested_next_full(self, phase_id: str) -> list[dict]:
-        """Get suggested_next with full metadata for each item.
-
-        Returns list of dicts with 'phase', 'instruction', 'requires_approval', 'approval_prompt'.
-        """
-        phase = self.get_phase(phase_id)
-        if not phase:
-            return []
-        suggested = phase.get("suggested_next", [])
-        result = []
-        for item in suggested:
-            if isinstance(item, str):
-                result.append({"phase": item, "requires_approval": False})
+                result.append(
+                    {"phase": item, "requires_approval": False}
+                )
             elif isinstance(item, dict):
                 # Ensure required fields are present
                 entry = {
@@ -686,6 +896,29 @@ class WorkflowManager:
                 result.append(entry)
         return result
 
+    def normalize_suggested_next(self, suggested_next: list) -> list[str]:
+        """Extract phase IDs from mixed string/object format.
+
+        Handles both:
+        - "phase-id" (string)
+        - {"phase": "phase-id", "requires_approval": true} (object)
+        """
+        return [
+            item["phase"]
+            for item in self._normalize_full(suggested_next)
+            if item["phase"]
+        ]
+
+    def get_suggested_next_full(self, phase_id: str) -> list[dict]:
+        """Get suggested_next with full metadata for each item.
+
+        Returns list of dicts with 'phase', 'instruction', 'requires_approval', 'approval_prompt'.
+        """
+        if not self.exists():
+            return []
+        self.load()
+        return self._suggested_full.get(phase_id, [])
+
     def get_approval_prompt(self, from_phase: str, to_phase: str) -> str | None:
         """Get approval prompt for a transition, if any."""
         for item in self.get_suggested_next_full(from_phase):
@@ -736,15 +969,16 @@ class WorkflowManager:
         # Load prompt_files if specified
         prompt_files = phase.get("prompt_files", [])
         if prompt_files:
-            plugin_root = Path(__file__).parent
+            manifest = _prompt_manifest("phases")
             for pf in prompt_files:
-                prompt_path = plugin_root / "prompts" / "phases" / f"{pf}.md"
-                if prompt_path.exists():
-                    content = prompt_path.read_text().strip()
+                prompt_path = manifest.get(pf)
+                content = _read_prompt(prompt_path) if prompt_path else None
+                if content is not None:
+                    content = content.strip()
                     if content:
                         parts.append(content)
                 else:
-                    print(f"Warning: prompt_file '{pf}' not found at {prompt_path}", file=sys.stderr)
+                    print(f"Warning: prompt_file '{pf}' not found in prompts/phases/", file=sys.stderr)
 
         # Add inline prompt
         inline_prompt = phase.get("prompt", "").strip()
@@ -909,28 +1143,44 @@ class WorkflowManager:
 
         workflow = self.load()
         phases = workflow.get("phases", [])
-        phase_ids = {p.get("id") for p in phases}
+        phase_ids = self._phase_ids
 
         for phase in phases:
             pid = phase.get("id")
 
-            # Check suggested_next references (handles both string and object format)
-            for item in phase.get("suggested_next", []):
-                if isinstance(item, str):
-                    target = item
-                elif isinstance(item, dict):
-                    target = item.get("phase", "")
-                    # Check approval_prompt is present when requires_approval is true
-                    if item.get("requires_approval") and not item.get("approval_prompt"):
-                        errors.append(f"Phase '{pid}' transition to '{target}' requires approval but has no approval_prompt")
-                else:
-                    continue
+            # Normalized entries always carry phase/requires_approval/approval_prompt
+            items = self._suggested_full.get(
+                pid, self._normalize_full(phase.get("suggested_next", []))
+            )
+            for item in items:
+                target = item["phase"]
+                # Check approval_prompt is present when requires_approval is true
+                if item["requires_approval"] and not item.get("approval_prompt"):
+                    errors.append(f"Phase '{pid}' transition to '{target}' requires approval but has no approval_prompt")
 
                 if target and target not in phase_ids and target not in ("complete", "__expand__"):
                     errors.append(f"Phase '{pid}' has suggested_next '{target}' which doesn't exist")
 
         return errors
 
+    def validate_all(self) -> list[str]:
+        """Run schema, phase-reference, and expandable validation in one call.
+
+        The parsed workflow is loaded once and shared across all three
+        checks; errors are returned in schema -> references -> expandable
+        order (matching the order they were historically reported).
+        """
+        if not self.exists():
+            return []
+        self.load()
+        return list(
+            itertools.chain(
+                self._iter_schema_errors(),
+                self.validate_phase_references(),
+                self.validate_expandable(),
+            )
+        )
+
     def is_expandable(self, phase_id: str) -> bool:
         """Check if phase has __expand__ marker in suggested_next."""
         # Use normalized version which extracts phase IDs from objects
@@ -944,147 +1194,132 @@ class WorkflowManager:
 
     def invalidate_cache(self):
         """Clear cached workflow to force reload."""
+        _parse_workflow_file.cache_clear()
         self._workflow = None
+        self._phase_by_id = {}
+        self._phase_ids = frozenset()
+        self._suggested_ids = {}
+        self._suggested_full = {}
+        self._has_expandable_phases = False
 
     def validate_schema(self) -> list[str]:
         """Validate workflow.toml schema - check for unknown/invalid fields.
 
         Returns list of error strings for unknown fields.
         """
-        errors = []
+        return list(self._iter_schema_errors())
+
+    def _iter_schema_errors(self):
+        """Yield schema errors lazily - check for unknown/invalid fields.
+
+        A generator so callers that only need the first few errors (or just
+        truthiness) don't pay for formatting every message on badly malformed
+        workflows; the valid-workflow path costs the same as before.
+        """
         if not self.exists():
-            return errors
+            return
 
         workflow = self.load()
 
-        # Valid top-level keys
-        VALID_TOP_LEVEL = {"workflow", "phases"}
-        for key in workflow.keys():
-            if key not in VALID_TOP_LEVEL:
-                errors.append(f"Unknown top-level key: '{key}' (valid: {VALID_TOP_LEVEL})")
+        # Unknown keys via C-level dict-view set difference
+        for key in sorted(workflow.keys() - _VALID_TOP_LEVEL_KEYS):
+            yield f"Unknown top-level key: '{key}' (valid: {set(_VALID_TOP_LEVEL_KEYS)})"
 
-        # Valid [workflow] section keys
-        VALID_WORKFLOW_KEYS = {"name", "description"}
         workflow_section = workflow.get("workflow", {})
         if isinstance(workflow_section, dict):
-            for key in workflow_section.keys():
-                if key not in VALID_WORKFLOW_KEYS:
-                    errors.append(f"Unknown [workflow] key: '{key}' (valid: {VALID_WORKFLOW_KEYS})")
-
-        # Valid [[phases]] keys
-        VALID_PHASE_KEYS = {
-            "id", "prompt", "prompt_files", "suggested_next", "terminal", "use_tasks",
-            "requires_user_input", "max_retries", "max_iterations",
-            "supports_proposals",  # deprecated: kept for compat with existing plans
-            "supports_prototypes", "supports_cache_reference",
-            "expand_prompt", "required_artifacts", "context_artifacts",
-            "required_tasks", "required_json_artifacts",
-            "planning_panel",
-        }
-        # Valid keys in suggested_next objects
-        VALID_TRANSITION_KEYS = {"phase", "instruction", "requires_approval", "approval_prompt"}
-
-        # Valid keys in required_tasks items
-        VALID_REQUIRED_TASK_KEYS = {
-            "id", "description", "prompt_file", "subagent", "subagent_prompt",
-            "model", "parents", "steps", "context_artifacts", "type",
-            "question", "hypothesis", "inject_project_context", "locks",
-            "executor", "inject_phase_prompt",
-        }
+            for key in sorted(workflow_section.keys() - _VALID_WORKFLOW_KEYS):
+                yield f"Unknown [workflow] key: '{key}' (valid: {set(_VALID_WORKFLOW_KEYS)})"
 
         phases = workflow.get("phases", [])
         if not isinstance(phases, list):
-            errors.append(f"'phases' must be an array, got {type(phases).__name__}")
-            return errors
+            yield f"'phases' must be an array, got {type(phases).__name__}"
+            return
 
         for i, phase in enumerate(phases):
             if not isinstance(phase, dict):
-                errors.append(f"Phase {i} must be a table, got {type(phase).__name__}")
+                yield f"Phase {i} must be a table, got {type(phase).__name__}"
                 continue
 
             phase_id = phase.get("id", f"<index {i}>")
-            for key in phase.keys():
-                if key not in VALID_PHASE_KEYS:
-                    errors.append(f"Phase '{phase_id}' has unknown key: '{key}' (valid: {sorted(VALID_PHASE_KEYS)})")
+            for key in sorted(phase.keys() - _VALID_PHASE_KEYS):
+                yield f"Phase '{phase_id}' has unknown key: '{key}' (valid: {_SORTED_VALID_PHASE_KEYS})"
 
             # Check required fields
             if "id" not in phase:
-                errors.append(f"Phase at index {i} missing required 'id' field")
+                yield f"Phase at index {i} missing required 'id' field"
             if "prompt" not in phase:
-                errors.append(f"Phase '{phase_id}' missing required 'prompt' field")
+                yield f"Phase '{phase_id}' missing required 'prompt' field"
 
             # Validate suggested_next items
             for item in phase.get("suggested_next", []):
                 if isinstance(item, dict):
-                    for key in item.keys():
-                        if key not in VALID_TRANSITION_KEYS:
-                            errors.append(f"Phase '{phase_id}' suggested_next has unknown key: '{key}' (valid: {VALID_TRANSITION_KEYS})")
+                    for key in sorted(item.keys() - _VALID_TRANSITION_KEYS):
+                        yield f"Phase '{phase_id}' suggested_next has unknown key: '{key}' (valid: {set(_VALID_TRANSITION_KEYS)})"
 
             # Validate required_tasks
             required_tasks = phase.get("required_tasks", [])
             if required_tasks:
                 # Check that use_tasks is true when required_tasks is set
                 if not phase.get("use_tasks"):
-                    errors.append(f"Phase '{phase_id}' has required_tasks but use_tasks is not true")
+                    yield f"Phase '{phase_id}' has required_tasks but use_tasks is not true"
 
                 if not isinstance(required_tasks, list):
-                    errors.append(f"Phase '{phase_id}' required_tasks must be an array")
+                    yield f"Phase '{phase_id}' required_tasks must be an array"
                 else:
                     seen_ids = set()
                     for j, task in enumerate(required_tasks):
                         if not isinstance(task, dict):
-                            errors.append(f"Phase '{phase_id}' required_tasks[{j}] must be a table")
+                            yield f"Phase '{phase_id}' required_tasks[{j}] must be a table"
                             continue
 
                         task_id = task.get("id", f"<index {j}>")
 
                         # Check for unknown keys
-                        for key in task.keys():
-                            if key not in VALID_REQUIRED_TASK_KEYS:
-                                errors.append(f"Phase '{phase_id}' required_tasks[{j}] has unknown key: '{key}' (valid: {sorted(VALID_REQUIRED_TASK_KEYS)})")
+                        for key in sorted(task.keys() - _VALID_REQUIRED_TASK_KEYS):
+                            yield f"Phase '{phase_id}' required_tasks[{j}] has unknown key: '{key}' (valid: {_SORTED_VALID_REQUIRED_TASK_KEYS})"
 
                         # Check required fields
                         if "id" not in task:
-                            errors.append(f"Phase '{phase_id}' required_tasks[{j}] missing required 'id' field")
+                            yield f"Phase '{phase_id}' required_tasks[{j}] missing required 'id' field"
                         if "description" not in task:
-                            errors.append(f"Phase '{phase_id}' required_tasks[{j}] (id={task_id}) missing required 'description' field")
+                            yield f"Phase '{phase_id}' required_tasks[{j}] (id={task_id}) missing required 'description' field"
 
                         # Check for duplicate IDs
                         if task_id in seen_ids:
-                            errors.append(f"Phase '{phase_id}' has duplicate required_task id: '{task_id}'")
+                            yield f"Phase '{phase_id}' has duplicate required_task id: '{task_id}'"
                         seen_ids.add(task_id)
 
                         # Validate parents is a list if present
                         parents = task.get("parents")
                         if parents is not None and not isinstance(parents, list):
-                            errors.append(f"Phase '{phase_id}' required_tasks[{j}] (id={task_id}) parents must be an array")
+                            yield f"Phase '{phase_id}' required_tasks[{j}] (id={task_id}) parents must be an array"
 
                         # Validate model if present
                         model = task.get("model")
                         if model is not None and model not in ("sonnet", "haiku", "opus"):
-                            errors.append(f"Phase '{phase_id}' required_tasks[{j}] (id={task_id}) has invalid model: '{model}' (valid: sonnet, haiku, opus)")
+                            yield f"Phase '{phase_id}' required_tasks[{j}] (id={task_id}) has invalid model: '{model}' (valid: sonnet, haiku, opus)"
 
             # Validate planning_panel constraints
             if phase.get("planning_panel"):
                 if not phase.get("use_tasks"):
-                    errors.append(f"Phase '{phase_id}' has planning_panel=true but use_tasks is not true")
+                    yield f"Phase '{phase_id}' has planning_panel=true but use_tasks is not true"
                 if required_tasks:
                     has_codex_executor = any(
                         t.get("executor") == "codex-cli" for t in required_tasks if isinstance(t, dict)
                     )
                     if not has_codex_executor:
-                        errors.append(f"Phase '{phase_id}' has planning_panel=true but no required_task with executor='codex-cli'")
+                        yield f"Phase '{phase_id}' has planning_panel=true but no required_task with executor='codex-cli'"
                     has_gemini_executor = any(
                         t.get("executor") == "gemini-cli" for t in required_tasks if isinstance(t, dict)
                     )
                     if not has_gemini_executor:
-                        errors.append(f"Phase '{phase_id}' has planning_panel=true but no required_task with executor='gemini-cli'")
+                        yield f"Phase '{phase_id}' has planning_panel=true but no required_task with executor='gemini-cli'"
 
             # Validate required_json_artifacts
             json_artifacts = phase.get("required_json_artifacts", [])
             if json_artifacts:
                 if not isinstance(json_artifacts, list):
-                    errors.append(f"Phase '{phase_id}' required_json_artifacts must be an array")
+                    yield f"Phase '{phase_id}' required_json_artifacts must be an array"
                 else:
                     seen_names = set()
                     for j, artifact in enumerate(json_artifacts):
@@ -1094,34 +1329,31 @@ class WorkflowManager:
                         elif isinstance(artifact, dict):
                             # Check required fields
                             if "name" not in artifact:
-                                errors.append(f"Phase '{phase_id}' required_json_artifacts[{j}] missing required 'name' field")
+                                yield f"Phase '{phase_id}' required_json_artifacts[{j}] missing required 'name' field"
                             if "schema" not in artifact:
-                                errors.append(f"Phase '{phase_id}' required_json_artifacts[{j}] missing required 'schema' field")
+                                yield f"Phase '{phase_id}' required_json_artifacts[{j}] missing required 'schema' field"
 
                             # Check for unknown keys
-                            valid_keys = {"name", "schema"}
-                            for key in artifact.keys():
-                                if key not in valid_keys:
-                                    errors.append(f"Phase '{phase_id}' required_json_artifacts[{j}] has unknown key: '{key}' (valid: {valid_keys})")
+                            for key in sorted(artifact.keys() - _VALID_JSON_ARTIFACT_KEYS):
+                                yield f"Phase '{phase_id}' required_json_artifacts[{j}] has unknown key: '{key}' (valid: {set(_VALID_JSON_ARTIFACT_KEYS)})"
 
                             name = artifact.get("name", f"<index {j}>")
                             schema = artifact.get("schema", "")
                         else:
-                            errors.append(
+                            yield (
                                 f"Phase '{phase_id}' required_json_artifacts[{j}] must be a string or table"
                             )
                             continue
 
                         # Check for duplicate names
                         if name in seen_names:
-                            errors.append(f"Phase '{phase_id}' has duplicate required_json_artifacts name: '{name}'")
+                            yield f"Phase '{phase_id}' has duplicate required_json_artifacts name: '{name}'"
                         seen_names.add(name)
 
                         # Schema name must not contain path separators
                         if "/" in schema or "\\" in schema:
-                            errors.append(f"Phase '{phase_id}' required_json_artifacts[{j}] schema name must not contain path separators: '{schema}'")
+                            yield f"Phase '{phase_id}' required_json_artifacts[{j}] schema name must not contain path separators: '{schema}'"
 
-        return errors
 
     def validate_expandable(self) -> list[str]:
         """Validate expandable phase configuration.
@@ -1133,10 +1365,17 @@ class WorkflowManager:
 
         Returns list of error strings.
         """
+        phases = self.get_all_phases()
+        # Most workflows have no expandable phases; skip the per-phase walk
+        if not self._has_expandable_phases:
+            return []
         errors = []
-        for phase in self.get_all_phases():
+        for phase in phases:
             # Use normalized suggested_next to handle both string and object formats
-            suggested_ids = self.normalize_suggested_next(phase.get("suggested_next", []))
+            suggested_ids = self._suggested_ids.get(
+                phase.get("id", ""),
+                self.normalize_suggested_next(phase.get("suggested_next", [])),
+            )
             has_expand_marker = "__expand__" in suggested_ids
             has_expand_prompt = "expand_prompt" in phase
 
@@ -1161,6 +1400,49 @@ class WorkflowManager:
         return errors
 
 
+@lru_cache(maxsize=128)
+def _read_prompt(path: str) -> str | None:
+    """Read a prompt/guidance file, cached for the process lifetime.
+
+    Prompt files are effectively static, so each path is read at most once
+    per process. Returns None if the file does not exist.
+    """
+    try:
+        return _read_bytes_fast(Path(path)).decode("utf-8")
+    except OSError:
+        return None
+
+
+@cache
+def _prompt_manifest(subdir: str) -> dict[str, str]:
+    """Map prompt-file stem -> path for prompts/<subdir>/*.md.
+
+    One scandir replaces a per-lookup existence probe; the plugin's prompt
+    set is static for the process lifetime.
+    """
+    base = PLUGIN_ROOT / "prompts" / subdir
+    try:
+        return {
+            entry.name[:-3]: entry.path
+            for entry in os.scandir(base)
+            if entry.name.endswith(".md")
+        }
+    except OSError:
+        return {}
+
+
+# (WorkflowManager predicate, prompts/ filename) pairs, applied in order by
+# get_assembled_prompts. A truthy predicate result includes the file.
+_PROMPT_RULES = (
+    ("uses_tasks", "task-execution.md"),
+    ("supports_cache_reference", "cache-reference.md"),
+    ("supports_prototypes", "prototype.md"),
+    ("get_max_iterations", "iteration-guidance.md"),
+    ("supports_validation", "validation-tasks.md"),
+    ("supports_test_definition", "test-definition.md"),
+)
+
+
 def get_assembled_prompts(workflow_mgr: "WorkflowManager", phase_id: str) -> str:
     """Assemble prompts based on workflow phase configuration flags.
 
@@ -1175,55 +1457,30 @@ def get_assembled_prompts(workflow_mgr: "WorkflowManager", phase_id: str) -> str
         Assembled prompt string with all applicable guidance
     """
     # Get the prompts directory (relative to plan.py location)
-    prompts_dir = Path(__file__).parent / "prompts"
+    prompts_dir = PLUGIN_ROOT / "prompts"
     if not prompts_dir.exists():
         return ""
 
     prompt_parts: list[str] = []
 
-    # Core task execution (required for any task-based phase)
-    if workflow_mgr.uses_tasks(phase_id):
-        task_exec_file = prompts_dir / "task-execution.md"
-        if task_exec_file.exists():
-            prompt_parts.append(task_exec_file.read_text())
-
-    # Optional task types
-    if workflow_mgr.supports_cache_reference(phase_id):
-        cache_ref_file = prompts_dir / "cache-reference.md"
-        if cache_ref_file.exists():
-            prompt_parts.append(cache_ref_file.read_text())
-
-    if workflow_mgr.supports_prototypes(phase_id):
-        prototype_file = prompts_dir / "prototype.md"
-        if prototype_file.exists():
-            prompt_parts.append(prototype_file.read_text())
-
-    # Research iteration support
-    if workflow_mgr.get_max_iterations(phase_id):
-        iteration_file = prompts_dir / "iteration-guidance.md"
-        if iteration_file.exists():
-            prompt_parts.append(iteration_file.read_text())
-
-    # Validation/test phases
-    if workflow_mgr.supports_validation(phase_id):
-        validation_file = prompts_dir / "validation-tasks.md"
-        if validation_file.exists():
-            prompt_parts.append(validation_file.read_text())
-
-    if workflow_mgr.supports_test_definition(phase_id):
-        test_def_file = prompts_dir / "test-definition.md"
-        if test_def_file.exists():
-            prompt_parts.append(test_def_file.read_text())
+    # Flag-gated prompt files, driven by the declarative rules table
+    for predicate, filename in _PROMPT_RULES:
+        if getattr(workflow_mgr, predicate)(phase_id):
+            text = _read_prompt(str(prompts_dir / filename))
+            if text is not None:
+                prompt_parts.append(text)
 
     # Task guidance for required JSON artifacts
     if workflow_mgr.uses_tasks(phase_id):
-        artifacts_dir = Path(__file__).parent / "artifacts"
+        artifacts_dir = PLUGIN_ROOT / "artifacts"
         for artifact_spec in workflow_mgr.get_required_json_artifacts(phase_id):
             artifact_name = artifact_spec.get("name", "")
             if artifact_name:
-                guidance_file = artifacts_dir / artifact_name / "task-guidance.md"
-                if guidance_file.exists():
-                    prompt_parts.append(guidance_file.read_text())
+                text = _read_prompt(
+                    str(artifacts_dir / artifact_name / "task-guidance.md")
+                )
+                if text is not None:
+                    prompt_parts.append(text)
 
     # User review instructions for phases requiring user input
     if workflow_mgr.requires_user_input(phase_id):
@@ -1268,7 +1525,23 @@ class ArtifactResolver:
 
     def __init__(self, plan_dir: Path):
         self.plan_dir = plan_dir
+        self._plan_dir_str = str(plan_dir)
         self.state_mgr = StateManager(plan_dir)
+        self._state_cache: dict | None = None
+        self._state_mtime_ns: int | None = None
+        # resolve_all memo: {exclude_current: (state_mtime_ns, result)}
+        self._resolved_cache: dict[bool, tuple[int | None, dict[str, Path]]] = {}
+
+    def _load_state(self) -> dict:
+        """Load state.json, reusing the parsed dict while the file is unchanged."""
+        try:
+            mtime_ns = self.state_mgr.state_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if self._state_cache is None or mtime_ns != self._state_mtime_ns:
+            self._state_cache = self.state_mgr.load()
+            self._state_mtime_ns = mtime_ns
+        return self._state_cache
 
     def resolve_all(self, exclude_current: bool = True) -> dict[str, Path]:
         """Get all artifacts from plan-level and prior phases.
@@ -1280,12 +1553,20 @@ class ArtifactResolver:
         Args:
             exclude_current: If True, excludes artifacts from the current phase entry
         """
-        state = self.state_mgr.load()
-        artifacts: dict[str, Path] = {}
+        state = self._load_state()
+
+        # Commands call this repeatedly on one resolver (e.g. verify_inputs
+        # followed by a direct resolve_all); reuse the built dict while
+        # state.json is unchanged.
+        cached = self._resolved_cache.get(exclude_current)
+        if cached is not None and cached[0] == self._state_mtime_ns:
+            return cached[1]
 
-        # Plan-level artifacts first (lowest priority - phase artifacts override)
-        for name, rel_path in state.get("plan_artifacts", {}).items():
-            artifacts[name] = self.plan_dir / rel_path
+        # Accumulate relative paths first; later entries override earlier
+        # ones, so only the surviving occurrence per name pays the Path
+        # construction at the end.
+        # Plan-level artifacts seed the dict (lowest priority).
+        rel_paths: dict[str, str] = dict(state.get("plan_artifacts", {}))
 
         current_entry = state.get("current_phase_entry", 0)
 
@@ -1295,27 +1576,45 @@ class ArtifactResolver:
                 continue
 
             # Accumulate artifacts (later entries override)
-            if "artifacts" in entry:
-                for filename, rel_path in entry["artifacts"].items():
-                    artifacts[filename] = self.plan_dir / rel_path
-
-        return artifacts
+            entry_artifacts = entry.get("artifacts")
+            if entry_artifacts:
+                rel_paths.update(entry_artifacts)
+
+        # os.path.join + a single Path() is cheaper than Path.__truediv__,
+        # which re-normalizes both operands
+        join = os.path.join
+        plan_dir_str = self._plan_dir_str
+        resolved = {
+            name: Path(join(plan_dir_str, rel)) for name, rel in rel_paths.items()
+        }
+        self._resolved_cache[exclude_current] = (self._state_mtime_ns, resolved)
+        return resolved
 
-    def verify_all(self, exclude_current: bool = True) -> tuple[list[Path], list[str]]:
-        """Verify all artifacts exist on disk.
+    def resolve_and_verify(
+        self, exclude_current: bool = True
+    ) -> tuple[dict[str, Path], list[Path], list[str]]:
+        """Resolve artifacts and verify their existence in a single pass.
 
-        Returns: (found_paths, missing_paths_as_strings)
+        Returns: (artifacts, found_paths, missing_paths_as_strings)
         """
         artifacts = self.resolve_all(exclude_current)
         found: list[Path] = []
         missing: list[str] = []
 
-        for filename, path in artifacts.items():
+        for path in artifacts.values():
             if path.exists():
                 found.append(path)
             else:
                 missing.append(str(path))
 
+        return artifacts, found, missing
+
+    def verify_all(self, exclude_current: bool = True) -> tuple[list[Path], list[str]]:
+        """Verify all artifacts exist on disk.
+
+        Returns: (found_paths, missing_paths_as_strings)
+        """
+        _, found, missing = self.resolve_and_verify(exclude_current)
         return found, missing
 
     # Legacy method for backward compatibility
@@ -1332,11 +1631,20 @@ class ArtifactResolver:
 
         Returns: {filename: Path, ...}
         """
-        state = self.state_mgr.load()
-        latest_entry = self._find_latest_entry(state, phase_id)
+        state = self._load_state()
+        latest_entry = next(
+            (
+                e
+                for e in reversed(state.get("phase_history", []))
+                if e.get("phase") == phase_id
+            ),
+            None,
+        )
         if latest_entry and "artifacts" in latest_entry:
+            join = os.path.join
+            plan_dir_str = self._plan_dir_str
             return {
-                filename: self.plan_dir / rel_path
+                filename: Path(join(plan_dir_str, rel_path))
                 for filename, rel_path in latest_entry["artifacts"].items()
             }
         return {}
@@ -1345,6 +1653,20 @@ class ArtifactResolver:
 # --- JSON Artifact Validation ---
 
 
+@lru_cache(maxsize=64)
+def _get_schema_validator(schema_path_str: str, mtime_ns: int):
+    """Return a compiled Draft202012Validator for a schema file.
+
+    Keyed on (path, mtime) so repeated validations against the same schema
+    skip re-parsing and re-compiling it. jsonschema is imported here, at
+    the point of use, so the many subcommands that never validate
+    artifacts don't pay its import cost on every invocation.
+    """
+    from jsonschema import Draft202012Validator
+
+    return Draft202012Validator(json.loads(_read_bytes_fast(Path(schema_path_str))))
+
+
 def validate_json_artifact(
     artifact_name: str,
     schema_name: str,
@@ -1365,26 +1687,21 @@ def validate_json_artifact(
     errors: list[str] = []
 
     # Find schema file (look in artifacts/{name}/ first, fall back to schemas/)
-    plugin_dir = Path(__file__).parent
-    schema_path = plugin_dir / "artifacts" / artifact_name / "schema.json"
+    schema_path = PLUGIN_ROOT / "artifacts" / artifact_name / "schema.json"
     if not schema_path.exists():
         # Fallback to legacy schemas/ directory
-        schema_path = plugin_dir / "schemas" / f"{schema_name}.schema.json"
+        schema_path = PLUGIN_ROOT / "schemas" / f"{schema_name}.schema.json"
     if not schema_path.exists():
         errors.append(f"Schema not found for artifact '{artifact_name}'")
         return errors
 
     # Find artifact in current phase
     state = state_mgr.load()
-    current_entry = state.get("current_phase_entry", 0)
     artifact_path = None
 
-    for entry in state.get("phase_history", []):
-        if entry.get("entry") == current_entry:
-            artifacts = entry.get("artifacts", {})
-            if artifact_name in artifacts:
-                artifact_path = plan_dir / artifacts[artifact_name]
-            break
+    artifacts = StateManager.current_phase_artifacts(state)
+    if artifact_name in artifacts:
+        artifact_path = plan_dir / artifacts[artifact_name]
 
     if artifact_path is None:
         errors.append(f"Artifact '{artifact_name}' not recorded in current phase")
@@ -1394,35 +1711,31 @@ def validate_json_artifact(
         errors.append(f"Artifact file not found: {artifact_path}")
         return errors
 
-    # Load and parse artifact JSON
+    # Load and parse artifact JSON (json.loads on raw bytes skips the
+    # buffered text-decode path of json.load)
     try:
-        with open(artifact_path) as f:
-            artifact_data = json.load(f)
+        artifact_data = json.loads(_read_bytes_fast(artifact_path))
     except json.JSONDecodeError as e:
         errors.append(f"Invalid JSON in artifact '{artifact_name}': {e}")
         return errors
 
-    # Load schema
+    # Load schema through the compiled-validator cache; jsonschema itself
+    # is imported lazily inside it
     try:
-        with open(schema_path) as f:
-            schema = json.load(f)
-    except json.JSONDecodeError as e:
-        errors.append(f"Invalid JSON in schema '{schema_name}': {e}")
-        return errors
-
-    # Validate using jsonschema
-    try:
-        import jsonschema
+        validator = _get_schema_validator(
+            str(schema_path), schema_path.stat().st_mtime_ns
+        )
     except ImportError:
         errors.append("jsonschema library not installed - cannot validate JSON artifacts")
         return errors
+    except json.JSONDecodeError as e:
+        errors.append(f"Invalid JSON in schema '{schema_name}': {e}")
+        return errors
 
-    try:
-        jsonschema.validate(artifact_data, schema)
-    except jsonschema.ValidationError as e:
-        # Format a helpful error message
-        path = ".".join(str(p) for p in e.absolute_path) if e.absolute_path else "(root)"
-        errors.append(f"Validation error at {path}: {e.message}")
+    # Collect every failure in one pass, not just the first
+    for error in validator.iter_errors(artifact_data):
+        path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "(root)"
+        errors.append(f"Validation error at {path}: {error.message}")
 
     return errors
 
@@ -1430,7 +1743,7 @@ def validate_json_artifact(
 # --- Research Cache ---
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """A cached research entry."""
 
@@ -1468,6 +1781,10 @@ class ResearchCache:
     MAX_FINDINGS_SIZE = 1_000_000  # 1MB max
     WARN_FINDINGS_SIZE = 100_000  # 100KB warning threshold
     GC_THRESHOLD = 100  # Run auto-GC when this many expired entries exist
+    GC_BATCH = 500  # Delete at most this many expired entries per transaction
+    GC_VACUUM_PAGES = 1000  # Pages reclaimed per incremental_vacuum pass
+    GC_SAMPLE_EVERY = 64  # Check the GC threshold once per this many calls
+    GC_SAMPLE_SECONDS = 60  # ...or when this much time has passed
     DEFAULT_TTL_DAYS = 30
 
     # Schema for external-content FTS5 with triggers
@@ -1488,7 +1805,10 @@ class ResearchCache:
 
     -- Indexes for common queries
     CREATE INDEX IF NOT EXISTS idx_expires ON research_entries(expires_at);
-    CREATE INDEX IF NOT EXISTS idx_query_norm ON research_entries(query_normalized);
+    -- idx_query_norm_id covers plain query_normalized lookups too, so no
+    -- separate single-column index (dropped for existing databases)
+    DROP INDEX IF EXISTS idx_query_norm;
+    CREATE INDEX IF NOT EXISTS idx_query_norm_id ON research_entries(query_normalized, id DESC);
     CREATE INDEX IF NOT EXISTS idx_source_type ON research_entries(source_type);
     CREATE INDEX IF NOT EXISTS idx_plan_id ON research_entries(plan_id);
 
@@ -1501,6 +1821,12 @@ class ResearchCache:
         tokenize='porter unicode61'
     );
 
+    -- One-time configuration markers (e.g. BM25 rank weights)
+    CREATE TABLE IF NOT EXISTS cache_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+
     -- Triggers to keep FTS in sync with main table
     CREATE TRIGGER IF NOT EXISTS research_ai AFTER INSERT ON research_entries BEGIN
         INSERT INTO research_fts(rowid, query, findings)
@@ -1520,10 +1846,40 @@ class ResearchCache:
     END;
     """
 
+    # Search statements as constants so sqlite3's statement cache can reuse
+    # the prepared form across calls ({expiry} is filled in at class scope).
+    # If pagination is ever added, use a keyset cursor on (score, e.id)
+    # rather than LIMIT/OFFSET: OFFSET re-runs the FTS match and bm25 sort
+    # for every row it skips.
+    # "Latest version per normalized query" is a grouped CTE joined against
+    # the FTS hits rather than a correlated MAX(id) subquery, so it runs once
+    # (index-only via idx_query_norm_id) instead of once per candidate row.
+    _SEARCH_SQL_TEMPLATE = """
+        WITH latest AS (
+            SELECT MAX(id) AS id FROM research_entries
+            GROUP BY query_normalized
+        )
+        SELECT
+            e.id, e.query, e.query_normalized, e.findings,
+            e.created_at, e.expires_at, e.source_type,
+            e.source_url, e.plan_id, e.supersedes_id,
+            bm25(research_fts) as score
+        FROM research_fts f
+        JOIN research_entries e ON f.rowid = e.id
+        JOIN latest l ON l.id = e.id
+        WHERE research_fts MATCH ?{expiry}
+        ORDER BY score ASC LIMIT ?
+    """
+    SEARCH_SQL = _SEARCH_SQL_TEMPLATE.format(expiry=" AND e.expires_at > ?")
+    SEARCH_SQL_INCLUDE_EXPIRED = _SEARCH_SQL_TEMPLATE.format(expiry="")
+
     def __init__(self, project_dir: Path):
         self.project_dir = project_dir
         self.cache_dir = project_dir / ".claude" / "jons-plan" / "research-cache"
         self.db_path = self.cache_dir / "cache.db"
+        self._conn: sqlite3.Connection | None = None
+        self._gc_call_counter = 0
+        self._gc_last_check = 0.0
         self._ensure_schema()
 
     def _ensure_schema(self) -> None:
@@ -1531,28 +1887,79 @@ class ResearchCache:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         with self._connect() as conn:
             conn.executescript(self.SCHEMA)
-            # Set BM25 weights (query 10x, findings 1x)
-            # Note: This may fail if already set, which is fine
-            try:
+            # Set BM25 weights (query 10x, findings 1x) exactly once, gated by
+            # a sentinel row instead of an expected-failure INSERT
+            configured = conn.execute(
+                "SELECT value FROM cache_meta WHERE key = 'bm25_configured'"
+            ).fetchone()
+            if not configured:
                 conn.execute(
                     "INSERT INTO research_fts(research_fts, rank) "
                     "VALUES('rank', 'bm25(10.0, 1.0)')"
                 )
-            except sqlite3.OperationalError:
-                pass  # Already configured
+                conn.execute(
+                    "INSERT INTO cache_meta (key, value) "
+                    "VALUES ('bm25_configured', '1')"
+                )
 
     def _connect(self) -> sqlite3.Connection:
-        """Create connection with appropriate settings."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
-        conn.execute("PRAGMA journal_mode = WAL")
-        conn.execute("PRAGMA auto_vacuum = incremental")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Return the per-instance connection, created lazily.
+
+        The connection is cached so PRAGMAs run once per instance instead of
+        on every operation; call sites use it as a transaction context
+        manager (`with self._connect() as conn:`), which commits/rolls back
+        without closing.
+
+        A single connection serves both reads and writes: the CLI is
+        single-threaded and short-lived, so a reader/writer split would add
+        locking without any concurrency to exploit. Cross-process contention
+        is handled by WAL plus busy_timeout.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            # With WAL a torn write can only lose the last transaction, which
+            # is acceptable for a research cache; NORMAL skips an fsync per
+            # commit
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = memory")
+            conn.execute("PRAGMA cache_size = -20000")  # 20MB page cache
+            conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
+            # Only takes effect if issued before the first table is created,
+            # i.e. on the connection _ensure_schema runs its DDL through
+            conn.execute("PRAGMA auto_vacuum = incremental")
+            conn.row_factory = sqlite3.Row
+            self._conn = conn
+        return self._conn
 
     @staticmethod
+    def _row_to_entry(row, now: int) -> CacheEntry:
+        """Build a CacheEntry from a row via positional indexing.
+
+        Column order matches the entry SELECTs (id, query, query_normalized,
+        findings, created_at, expires_at, source_type, source_url, plan_id,
+        supersedes_id[, score]); positional access skips sqlite3.Row's
+        per-field name lookup.
+        """
+        return CacheEntry(
+            *row[:10],
+            is_expired=row[5] <= now,
+            score=row[10] if len(row) > 10 else None,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
     def normalize_query(query: str) -> str:
-        """Normalize query for duplicate detection: lowercase, trim, collapse whitespace."""
+        """Normalize query for duplicate detection: lowercase, trim, collapse whitespace.
+
+        Pure string transform, so repeated queries (retries, batch imports
+        with duplicates) are memoized.
+
+        str.split() with no argument collapses runs of any whitespace and
+        drops leading/trailing whitespace in one C-level pass, so no regex
+        is needed here.
+        """
         return " ".join(query.lower().split())
 
     def add(
@@ -1583,69 +1990,135 @@ class ResearchCache:
         Raises:
             ValueError: If findings exceed MAX_FINDINGS_SIZE
         """
-        if ttl_days is None:
-            ttl_days = self.DEFAULT_TTL_DAYS
+        return self.add_many(
+            [
+                {
+                    "query": query,
+                    "findings": findings,
+                    "ttl_days": ttl_days,
+                    "source_type": source_type,
+                    "source_url": source_url,
+                    "plan_id": plan_id,
+                }
+            ],
+            replace=replace,
+        )[0]
 
-        # Size check
-        if len(findings) > self.MAX_FINDINGS_SIZE:
-            raise ValueError(
-                f"Findings too large ({len(findings)} bytes). "
-                f"Maximum is {self.MAX_FINDINGS_SIZE} bytes."
-            )
-        if len(findings) > self.WARN_FINDINGS_SIZE:
-            print(
-                f"Warning: Large findings ({len(findings)} bytes). "
-                f"Consider summarizing.",
-                file=sys.stderr,
-            )
+    def add_many(self, entries: list[dict], replace: bool = False) -> list[int]:
+        """
+        Add multiple research entries in one transaction. Returns entry ids.
 
-        query_normalized = self.normalize_query(query)
-        expires_at = int(datetime.now().timestamp()) + (ttl_days * 86400)
+        Each entry dict takes the same keys as add()'s arguments: query,
+        findings, and optionally ttl_days, source_type, source_url, plan_id.
+        Existing-entry lookups are batched into one query, all inserts share
+        one commit, and opportunistic GC runs at most once — amortizing the
+        per-call SQLite overhead across the batch.
 
-        with self._connect() as conn:
-            # Check for existing entry with same normalized query
-            existing = conn.execute(
-                "SELECT id FROM research_entries WHERE query_normalized = ?",
-                (query_normalized,),
-            ).fetchone()
+        Raises:
+            ValueError: If any entry's findings exceed MAX_FINDINGS_SIZE
+        """
+        if not entries:
+            return []
 
-            supersedes_id = None
-            if existing:
-                if replace:
-                    # Delete existing entry
-                    conn.execute(
-                        "DELETE FROM research_entries WHERE id = ?", (existing["id"],)
-                    )
-                else:
-                    # Track supersession
-                    supersedes_id = existing["id"]
+        # time.time() gives the same epoch seconds without building a
+        # datetime object per batch
+        now = int(time.time())
+        prepared = []
+        for entry in entries:
+            query = entry["query"]
+            findings = entry["findings"]
+            ttl_days = entry.get("ttl_days")
+            if ttl_days is None:
+                ttl_days = self.DEFAULT_TTL_DAYS
+
+            # Size check
+            if len(findings) > self.MAX_FINDINGS_SIZE:
+                raise ValueError(
+                    f"Findings too large ({len(findings)} bytes). "
+                    f"Maximum is {self.MAX_FINDINGS_SIZE} bytes."
+                )
+            if len(findings) > self.WARN_FINDINGS_SIZE:
+                print(
+                    f"Warning: Large findings ({len(findings)} bytes). "
+                    f"Consider summarizing.",
+                    file=sys.stderr,
+                )
 
-            # Insert new entry
-            cursor = conn.execute(
-                """
-                INSERT INTO research_entries
-                (query, query_normalized, findings, expires_at, source_type,
-                 source_url, plan_id, supersedes_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            prepared.append(
                 (
                     query,
-                    query_normalized,
+                    self.normalize_query(query),
                     findings,
-                    expires_at,
-                    source_type,
-                    source_url,
-                    plan_id,
-                    supersedes_id,
-                ),
+                    now + (ttl_days * 86400),
+                    entry.get("source_type", "web_search"),
+                    entry.get("source_url"),
+                    entry.get("plan_id"),
+                )
             )
-            entry_id = cursor.lastrowid
+
+        entry_ids: list[int] = []
+        with self._connect() as conn:
+            # Look up existing entries for all normalized queries at once
+            # (chunked to stay under SQLite's parameter limit)
+            existing_by_norm: dict[str, int] = {}
+            norms = [p[1] for p in prepared]
+            for i in range(0, len(norms), 999):
+                chunk = norms[i : i + 999]
+                placeholders = ",".join("?" * len(chunk))
+                for row in conn.execute(
+                    "SELECT id, query_normalized FROM research_entries "
+                    f"WHERE query_normalized IN ({placeholders})",
+                    chunk,
+                ):
+                    existing_by_norm[row["query_normalized"]] = row["id"]
+
+            for query, query_normalized, findings, expires_at, source_type, source_url, plan_id in prepared:
+                supersedes_id = None
+                existing_id = existing_by_norm.get(query_normalized)
+                if existing_id is not None:
+                    if replace:
+                        # Delete existing entry
+                        conn.execute(
+                            "DELETE FROM research_entries WHERE id = ?",
+                            (existing_id,),
+                        )
+                    else:
+                        # Track supersession
+                        supersedes_id = existing_id
+
+                cursor = conn.execute(
+                    """
+                    INSERT INTO research_entries
+                    (query, query_normalized, findings, expires_at, source_type,
+                     source_url, plan_id, supersedes_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        query,
+                        query_normalized,
+                        findings,
+                        expires_at,
+                        source_type,
+                        source_url,
+                        plan_id,
+                        supersedes_id,
+                    ),
+                )
+                # Later duplicates within the batch supersede/replace this row,
+                # matching the behavior of serial add() calls
+                existing_by_norm[query_normalized] = cursor.lastrowid
+                entry_ids.append(cursor.lastrowid)
+
             conn.commit()
 
-            # Opportunistic GC
+            # Opportunistic GC, once per batch
             self._maybe_gc(conn)
 
-            return entry_id
+            # Refresh planner statistics when warranted; PRAGMA optimize is
+            # a cheap partial ANALYZE designed to run after write bursts
+            conn.execute("PRAGMA optimize")
+
+        return entry_ids
 
     def search(
         self, query: str, limit: int = 5, include_expired: bool = False
@@ -1664,59 +2137,29 @@ class ResearchCache:
         Returns:
             List of CacheEntry objects sorted by relevance
         """
-        now = int(datetime.now().timestamp())
+        now = int(time.time())
 
         with self._connect() as conn:
-            # Build query with optional expiry filter
-            sql = """
-                SELECT
-                    e.id, e.query, e.query_normalized, e.findings,
-                    e.created_at, e.expires_at, e.source_type,
-                    e.source_url, e.plan_id, e.supersedes_id,
-                    bm25(research_fts) as score
-                FROM research_fts f
-                JOIN research_entries e ON f.rowid = e.id
-                WHERE research_fts MATCH ?
-            """
-            params: list = [query]
-
-            if not include_expired:
-                sql += " AND e.expires_at > ?"
-                params.append(now)
-
-            # Only return latest version of each normalized query
-            sql += """
-                AND e.id = (
-                    SELECT MAX(e2.id) FROM research_entries e2
-                    WHERE e2.query_normalized = e.query_normalized
-                )
-            """
-
-            sql += " ORDER BY score ASC LIMIT ?"
-            params.append(limit)
-
-            rows = conn.execute(sql, params).fetchall()
+            # Constant SQL strings let sqlite3's per-connection statement
+            # cache reuse the prepared statement across calls
+            if include_expired:
+                sql = self.SEARCH_SQL_INCLUDE_EXPIRED
+                params = (query, limit)
+            else:
+                sql = self.SEARCH_SQL
+                params = (query, now, limit)
+
+            # Build entries straight off the cursor; fetchall() would
+            # materialize every row a second time first
+            entries = [
+                self._row_to_entry(row, now)
+                for row in conn.execute(sql, params)
+            ]
 
             # Opportunistic GC (less frequent for searches)
             self._maybe_gc(conn)
 
-            return [
-                CacheEntry(
-                    id=row["id"],
-                    query=row["query"],
-                    query_normalized=row["query_normalized"],
-                    findings=row["findings"],
-                    created_at=row["created_at"],
-                    expires_at=row["expires_at"],
-                    source_type=row["source_type"],
-                    source_url=row["source_url"],
-                    plan_id=row["plan_id"],
-                    supersedes_id=row["supersedes_id"],
-                    is_expired=row["expires_at"] <= now,
-                    score=row["score"],
-                )
-                for row in rows
-            ]
+            return entries
 
     def get(self, entry_id: int, allow_expired: bool = False) -> CacheEntry | None:
         """
@@ -1729,7 +2172,7 @@ class ResearchCache:
         Returns:
             CacheEntry if found (and not expired unless allow_expired), None otherwise
         """
-        now = int(datetime.now().timestamp())
+        now = int(time.time())
 
         with self._connect() as conn:
             row = conn.execute(
@@ -1744,23 +2187,10 @@ class ResearchCache:
             if not row:
                 return None
 
-            is_expired = row["expires_at"] <= now
-            if is_expired and not allow_expired:
+            entry = self._row_to_entry(row, now)
+            if entry.is_expired and not allow_expired:
                 return None
-
-            return CacheEntry(
-                id=row["id"],
-                query=row["query"],
-                query_normalized=row["query_normalized"],
-                findings=row["findings"],
-                created_at=row["created_at"],
-                expires_at=row["expires_at"],
-                source_type=row["source_type"],
-                source_url=row["source_url"],
-                plan_id=row["plan_id"],
-                supersedes_id=row["supersedes_id"],
-                is_expired=is_expired,
-            )
+            return entry
 
     def clear(
         self,
@@ -1787,7 +2217,11 @@ class ResearchCache:
                 "Must specify --id, --query, or --all to clear entries"
             )
 
-        with self._connect() as conn:
+        conn = self._connect()
+        # Grab the writer lock up front instead of upgrading mid-transaction
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
             if all_entries:
                 cursor = conn.execute("DELETE FROM research_entries")
             elif entry_id:
@@ -1801,31 +2235,68 @@ class ResearchCache:
                     (query_normalized,),
                 )
             else:
+                conn.commit()
                 return 0
-
             count = cursor.rowcount
-            conn.commit()
-            return count
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return count
 
     def gc(self) -> int:
-        """Delete expired entries. Returns count deleted."""
-        now = int(datetime.now().timestamp())
-        with self._connect() as conn:
+        """Delete expired entries in bounded batches. Returns count deleted.
+
+        Each batch commits separately so the writer lock is held briefly
+        instead of for the whole deletion when many entries have expired.
+        """
+        now = int(time.time())
+        conn = self._connect()
+        count = 0
+        while True:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
             cursor = conn.execute(
-                "DELETE FROM research_entries WHERE expires_at <= ?", (now,)
+                "DELETE FROM research_entries WHERE id IN ("
+                "  SELECT id FROM research_entries WHERE expires_at <= ? LIMIT ?"
+                ")",
+                (now, self.GC_BATCH),
             )
-            count = cursor.rowcount
             conn.commit()
-            # Reclaim space
-            conn.execute("PRAGMA incremental_vacuum")
-            return count
+            count += cursor.rowcount
+            if cursor.rowcount < self.GC_BATCH:
+                break
+        # Reclaim space once, after all batches. The vacuum pass forces a
+        # WAL checkpoint under the writer lock, so skip it entirely when
+        # nothing was deleted; GC_VACUUM_PAGES bounds it otherwise.
+        if count:
+            conn.execute(f"PRAGMA incremental_vacuum({self.GC_VACUUM_PAGES})")
+        return count
 
     def _maybe_gc(self, conn: sqlite3.Connection) -> None:
-        """Run GC if expired count exceeds threshold."""
-        result = conn.execute(
-            "SELECT COUNT(*) as cnt FROM research_entries WHERE expires_at <= unixepoch()"
+        """Run GC if expired count exceeds threshold.
+
+        Sampled: the check runs on the first call and then every
+        GC_SAMPLE_EVERY calls or GC_SAMPLE_SECONDS, whichever comes first,
+        so reads stay reads on the hot path. The threshold probe asks
+        whether a row exists past GC_THRESHOLD instead of counting every
+        expired row.
+        """
+        self._gc_call_counter += 1
+        if (
+            self._gc_call_counter % self.GC_SAMPLE_EVERY != 1
+            and time.monotonic() - self._gc_last_check < self.GC_SAMPLE_SECONDS
+        ):
+            return
+        self._gc_last_check = time.monotonic()
+        over_threshold = conn.execute(
+            "SELECT 1 FROM research_entries WHERE expires_at <= unixepoch()"
+            " LIMIT 1 OFFSET ?",
+            (self.GC_THRESHOLD,),
         ).fetchone()
-        if result and result["cnt"] > self.GC_THRESHOLD:
+        if over_threshold:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
             conn.execute(
                 "DELETE FROM research_entries WHERE expires_at <= unixepoch()"
             )
@@ -1833,27 +2304,22 @@ class ResearchCache:
 
     def stats(self) -> CacheStats:
         """Return cache statistics."""
-        now = int(datetime.now().timestamp())
+        now = int(time.time())
 
         with self._connect() as conn:
-            # Total entries
-            total = conn.execute(
-                "SELECT COUNT(*) as cnt FROM research_entries"
-            ).fetchone()["cnt"]
-
-            # Active vs expired
-            active = conn.execute(
-                "SELECT COUNT(*) as cnt FROM research_entries WHERE expires_at > ?",
+            # Totals, active count, and created_at range in one table pass
+            # via conditional aggregation
+            agg = conn.execute(
+                "SELECT COUNT(*) as total, "
+                "  COALESCE(SUM(expires_at > ?), 0) as active, "
+                "  MIN(created_at) as oldest, MAX(created_at) as newest "
+                "FROM research_entries",
                 (now,),
-            ).fetchone()["cnt"]
-
-            # Oldest and newest
-            times = conn.execute(
-                "SELECT MIN(created_at) as oldest, MAX(created_at) as newest "
-                "FROM research_entries"
             ).fetchone()
+            total = agg["total"]
+            active = agg["active"]
 
-            # Entries by source type
+            # Entries by source type (different grouping, separate query)
             by_source = {}
             for row in conn.execute(
                 "SELECT source_type, COUNT(*) as cnt FROM research_entries "
@@ -1871,12 +2337,23 @@ class ResearchCache:
                 active_entries=active,
                 expired_entries=total - active,
                 total_size_kb=size_kb,
-                oldest_entry=times["oldest"],
-                newest_entry=times["newest"],
+                oldest_entry=agg["oldest"],
+                newest_entry=agg["newest"],
                 entries_by_source=by_source,
             )
 
 
+@lru_cache(maxsize=4)
+def _get_research_cache(project_dir_str: str) -> ResearchCache:
+    """Process-wide ResearchCache per project directory.
+
+    Construction runs mkdir plus the schema DDL against SQLite, so callers
+    that may touch the cache more than once in a process share one instance
+    (and its open connection) instead of re-paying that setup.
+    """
+    return ResearchCache(Path(project_dir_str))
+
+
 # --- Subcommand handlers ---
 
 
@@ -1922,8 +2399,7 @@ def _append_reflog_entry(project_dir: Path, plan_name: str, previous_plan: str |
         "timestamp": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
         "previous": previous_plan,
     }
-    with open(reflog_file, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _append_line(reflog_file, json.dumps(entry) + "\n")
 
 
 def cmd_set_active(args: argparse.Namespace) -> int:
@@ -2040,10 +2516,12 @@ def cmd_task_stats(args: argparse.Namespace) -> int:
         return 1
 
     tasks = get_tasks(plan_dir)
-    todo = sum(1 for t in tasks if t.get("status") == "todo")
-    in_progress = sum(1 for t in tasks if t.get("status") == "in-progress")
-    done = sum(1 for t in tasks if t.get("status") == "done")
-    blocked = sum(1 for t in tasks if t.get("status") == "blocked")
+    # One pass over tasks instead of one generator sum per status
+    counts = Counter(t.get("status") for t in tasks)
+    todo = counts["todo"]
+    in_progress = counts["in-progress"]
+    done = counts["done"]
+    blocked = counts["blocked"]
     total = len(tasks)
 
     if blocked > 0:
@@ -2115,6 +2593,20 @@ def has_lock_conflict(task: dict, all_tasks: list) -> bool:
     return False
 
 
+def held_locks(tasks: list) -> set[str]:
+    """Union of locks held by in-progress tasks.
+
+    Batch-friendly alternative to calling has_lock_conflict per candidate
+    (which rescans every task each call): compute once, then test each
+    candidate with `held & set(task locks)`.
+    """
+    held: set[str] = set()
+    for t in tasks:
+        if t.get("status") == "in-progress":
+            held.update(t.get("locks", ()))
+    return held
+
+
 def cmd_next_tasks(args: argparse.Namespace) -> int:
     """List available tasks (todo with all parents done)."""
     project_dir = get_project_dir()
@@ -2123,14 +2615,15 @@ def cmd_next_tasks(args: argparse.Namespace) -> int:
         return 1
 
     tasks = get_tasks(plan_dir)
-    task_status = {t["id"]: t.get("status") for t in tasks}
+    done_ids = {t["id"] for t in tasks if t.get("status") == "done"}
+    locked = held_locks(tasks)
 
     for task in tasks:
         if task.get("status") != "todo":
             continue
-        parents = task.get("parents", [])
-        if all(task_status.get(pid) == "done" for pid in parents):
-            if not has_lock_conflict(task, tasks):
+        # C-level subset test instead of a per-parent dict lookup
+        if done_ids.issuperset(task.get("parents", ())):
+            if not locked.intersection(task.get("locks", ())):
                 print(f"{task['id']}: {task.get('description', '')}")
     return 0
 
@@ -2147,12 +2640,8 @@ def cmd_set_status(args: argparse.Namespace) -> int:
         print("No active plan", file=sys.stderr)
         return 1
 
-    tasks = get_tasks(plan_dir)
-    found_task = None
-    for task in tasks:
-        if task["id"] == args.task_id:
-            found_task = task
-            break
+    tasks, tasks_by_id = get_tasks_indexed(plan_dir)
+    found_task = tasks_by_id.get(args.task_id)
 
     if not found_task:
         print(f"Task not found: {args.task_id}", file=sys.stderr)
@@ -2175,9 +2664,9 @@ def cmd_set_status(args: argparse.Namespace) -> int:
             print("  - Suggested resolution", file=sys.stderr)
             return 1
 
-    # Update status
+    # Update status (patches the serialized value in place when possible)
     found_task["status"] = args.status
-    tasks_file = save_tasks(plan_dir, tasks)
+    tasks_file = update_task_status(plan_dir, args.task_id, args.status)
     if tasks_file:
         print(f"Updated: {tasks_file}")
     else:
@@ -2261,12 +2750,9 @@ def cmd_parent_dirs(args: argparse.Namespace) -> int:
     if not plan_dir:
         return 1
 
-    tasks = get_tasks(plan_dir)
-    parents = []
-    for task in tasks:
-        if task["id"] == args.task_id:
-            parents = task.get("parents", [])
-            break
+    _, tasks_by_id = get_tasks_indexed(plan_dir)
+    task = tasks_by_id.get(args.task_id)
+    parents = task.get("parents", []) if task else []
 
     for parent_id in parents:
         parent_dir = get_task_output_dir(plan_dir, parent_id)
@@ -2297,9 +2783,8 @@ def cmd_task_log(args: argparse.Namespace) -> int:
         return 1
 
     # Verify task exists
-    tasks = get_tasks(plan_dir)
-    task_exists = any(t["id"] == args.task_id for t in tasks)
-    if not task_exists:
+    _, tasks_by_id = get_tasks_indexed(plan_dir)
+    if args.task_id not in tasks_by_id:
         print(f"Task not found: {args.task_id}", file=sys.stderr)
         return 1
 
@@ -2312,9 +2797,7 @@ def cmd_task_log(args: argparse.Namespace) -> int:
 
     # Append to progress.txt
     progress_file = task_dir / "progress.txt"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(progress_file, "a") as f:
-        f.write(f"[{timestamp}] {args.message}\n")
+    _append_line(progress_file, f"[{_progress_timestamp()}] {args.message}\n")
 
     return 0
 
@@ -2337,9 +2820,7 @@ def cmd_phase_log(args: argparse.Namespace) -> int:
     phase_dir = plan_dir / current_dir
     phase_dir.mkdir(parents=True, exist_ok=True)
     progress_file = phase_dir / "progress.txt"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(progress_file, "a") as f:
-        f.write(f"[{timestamp}] {args.message}\n")
+    _append_line(progress_file, f"[{_progress_timestamp()}] {args.message}\n")
 
     return 0
 
@@ -2382,9 +2863,8 @@ def cmd_record_confidence(args: argparse.Namespace) -> int:
         return 1
 
     # Verify task exists
-    tasks = get_tasks(plan_dir)
-    task_exists = any(t["id"] == args.task_id for t in tasks)
-    if not task_exists:
+    _, tasks_by_id = get_tasks_indexed(plan_dir)
+    if args.task_id not in tasks_by_id:
         print(f"Task not found: {args.task_id}", file=sys.stderr)
         return 1
 
@@ -2402,7 +2882,7 @@ def cmd_record_confidence(args: argparse.Namespace) -> int:
         "timestamp": datetime.now().isoformat(),
     }
     confidence_file = task_dir / "confidence.json"
-    confidence_file.write_text(json.dumps(confidence_data, indent=2) + "\n")
+    _dump_json(confidence_file, confidence_data)
     print(f"Recorded: {confidence_file}")
 
     # Log to task progress
@@ -2433,11 +2913,11 @@ def cmd_check_confidence(args: argparse.Namespace) -> int:
         return 1
     confidence_file = task_dir / "confidence.json"
 
-    if not confidence_file.exists():
+    try:
+        data = json.loads(_read_bytes_fast(confidence_file))
+    except OSError:
         print(f"No confidence recorded for task: {args.task_id}", file=sys.stderr)
         return 1
-
-    data = json.loads(confidence_file.read_text())
     print(f"Score: {data['score']}/5")
     print(f"Rationale: {data['rationale']}")
     print(f"Recorded: {data['timestamp']}")
@@ -2458,7 +2938,7 @@ def cmd_low_confidence_tasks(args: argparse.Namespace) -> int:
     if not state_file.exists():
         return 0  # No phase, no tasks
     try:
-        state = json.loads(state_file.read_text())
+        state = json.loads(_read_bytes_fast(state_file))
         phase_dir = state.get("current_phase_dir")
         if not phase_dir:
             return 0  # No current phase
@@ -2473,11 +2953,12 @@ def cmd_low_confidence_tasks(args: argparse.Namespace) -> int:
     for task_dir in tasks_dir.iterdir():
         if not task_dir.is_dir():
             continue
-        confidence_file = task_dir / "confidence.json"
-        if confidence_file.exists():
-            data = json.loads(confidence_file.read_text())
-            if data["score"] < 4:
-                low_confidence.append((task_dir.name, data["score"], data["rationale"]))
+        try:
+            data = json.loads(_read_bytes_fast(task_dir / "confidence.json"))
+        except OSError:
+            continue
+        if data["score"] < 4:
+            low_confidence.append((task_dir.name, data["score"], data["rationale"]))
 
     if low_confidence:
         for task_id, score, rationale in sorted(low_confidence, key=lambda x: x[1]):
@@ -2535,11 +3016,11 @@ def cmd_add_task(args: argparse.Namespace) -> int:
     if args.json_file == "-":
         task_json = sys.stdin.read()
     else:
-        json_path = Path(args.json_file)
-        if not json_path.exists():
+        try:
+            task_json = _read_bytes_fast(Path(args.json_file))
+        except OSError:
             print(f"File not found: {args.json_file}", file=sys.stderr)
             return 1
-        task_json = json_path.read_text()
 
     try:
         new_task = json.loads(task_json)
@@ -2592,15 +3073,10 @@ def cmd_update_task_parents(args: argparse.Namespace) -> int:
         print("No active plan", file=sys.stderr)
         return 1
 
-    tasks = get_tasks(plan_dir)
-    task_ids = {t["id"] for t in tasks}
+    tasks, tasks_by_id = get_tasks_indexed(plan_dir)
 
     # Find the task
-    target_task = None
-    for task in tasks:
-        if task["id"] == args.task_id:
-            target_task = task
-            break
+    target_task = tasks_by_id.get(args.task_id)
 
     if not target_task:
         print(f"Task not found: {args.task_id}", file=sys.stderr)
@@ -2608,7 +3084,7 @@ def cmd_update_task_parents(args: argparse.Namespace) -> int:
 
     # Validate parent references
     for parent_id in args.parent_ids:
-        if parent_id not in task_ids:
+        if parent_id not in tasks_by_id:
             print(f"Parent task not found: {parent_id}", file=sys.stderr)
             return 1
         if parent_id == args.task_id:
@@ -2657,14 +3133,10 @@ def cmd_update_task_steps(args: argparse.Namespace) -> int:
         print("Steps must be a JSON array", file=sys.stderr)
         return 1
 
-    tasks = get_tasks(plan_dir)
+    tasks, tasks_by_id = get_tasks_indexed(plan_dir)
 
     # Find the task
-    target_task = None
-    for task in tasks:
-        if task["id"] == args.task_id:
-            target_task = task
-            break
+    target_task = tasks_by_id.get(args.task_id)
 
     if not target_task:
         print(f"Task not found: {args.task_id}", file=sys.stderr)
@@ -2684,6 +3156,17 @@ def cmd_update_task_steps(args: argparse.Namespace) -> int:
     return 0
 
 
+# One compiled alternation scans the description once instead of one
+# substring search per keyword. "look ?up" covers both "lookup" and
+# "look up"; "documentation"/"research"/"search for" subsume the longer
+# phrases from the original keyword list.
+_RESEARCH_RE = re.compile(
+    r"research|investigate|explore|find out|look ?up|search for"
+    r"|documentation|web search|find examples",
+    re.IGNORECASE,
+)
+
+
 def is_research_task(task: dict) -> bool:
     """Detect if a task is research-oriented and should check the cache.
 
@@ -2696,18 +3179,7 @@ def is_research_task(task: dict) -> bool:
         return False
 
     # Check description for research keywords
-    description = task.get("description", "").lower()
-    research_keywords = [
-        "research", "investigate", "explore", "find out", "lookup",
-        "look up", "search for", "documentation", "web search",
-        "find documentation", "find examples"
-    ]
-
-    for keyword in research_keywords:
-        if keyword in description:
-            return True
-
-    return False
+    return bool(_RESEARCH_RE.search(task.get("description", "")))
 
 
 def get_cache_suggestions_for_task(project_dir: Path, task: dict, limit: int = 3) -> list[dict]:
@@ -2720,12 +3192,19 @@ def get_cache_suggestions_for_task(project_dir: Path, task: dict, limit: int = 3
         return []
 
     try:
-        cache = ResearchCache(project_dir)
+        cache = _get_research_cache(str(project_dir))
         hits = cache.search(description, limit=limit, include_expired=False)
 
-        # Filter by relevance (lower BM25 score = more relevant)
+        # Filter by relevance (lower BM25 score = more relevant). Search
+        # returns hits ordered by score ascending, so stop at the first one
+        # past the threshold instead of testing the whole tail.
         RELEVANCE_THRESHOLD = 0.0
-        relevant_hits = [h for h in hits if h.score is not None and h.score <= RELEVANCE_THRESHOLD]
+        relevant_hits = list(
+            itertools.takewhile(
+                lambda h: h.score is not None and h.score <= RELEVANCE_THRESHOLD,
+                hits,
+            )
+        )
 
         return [
             {"id": h.id, "query": h.query, "score": round(h.score, 2) if h.score else None}
@@ -2745,12 +3224,8 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
         return 1
 
     # Find the task
-    tasks = get_tasks(plan_dir)
-    task = None
-    for t in tasks:
-        if t["id"] == args.task_id:
-            task = t
-            break
+    tasks, tasks_by_id = get_tasks_indexed(plan_dir)
+    task = tasks_by_id.get(args.task_id)
 
     if not task:
         print(f"Task not found: {args.task_id}", file=sys.stderr)
@@ -2779,16 +3254,15 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
     # 1c. Plugin prompt file - inject specialized instructions from prompts/tasks/ directory
     prompt_file = task.get("prompt_file")
     if prompt_file:
-        # Plugin root is where this script lives
-        plugin_root = Path(__file__).parent
-        prompt_path = plugin_root / "prompts" / "tasks" / f"{prompt_file}.md"
-        if prompt_path.exists():
-            prompt_content = prompt_path.read_text().strip()
+        prompt_path = _prompt_manifest("tasks").get(prompt_file)
+        prompt_content = _read_prompt(prompt_path) if prompt_path else None
+        if prompt_content is not None:
+            prompt_content = prompt_content.strip()
             if prompt_content:
                 prompt_parts.append(f"\n\n## Instructions\n\n{prompt_content}")
         else:
             # Warn but don't fail - the prompt file might be optional
-            print(f"Warning: prompt_file '{prompt_file}' not found at {prompt_path}", file=sys.stderr)
+            print(f"Warning: prompt_file '{prompt_file}' not found in prompts/tasks/", file=sys.stderr)
 
     # 1d. Phase prompt injection - when inject_phase_prompt=true, inject the current
     # phase's prompt into the task prompt under a demarcated heading
@@ -2798,7 +3272,7 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
             plan_dir_for_phase = get_active_plan_dir(project_dir_for_phase)
             if plan_dir_for_phase:
                 wm = WorkflowManager(plan_dir_for_phase)
-                state = json.loads((plan_dir_for_phase / "state.json").read_text())
+                state = json.loads(_read_bytes_fast(plan_dir_for_phase / "state.json"))
                 current_phase_id = state.get("current_phase")
                 if current_phase_id:
                     phase_prompt = wm.get_phase_prompt(current_phase_id)
@@ -2833,17 +3307,22 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
             project_dir / "CLAUDE.md",
         ]
         for claude_path in claude_md_paths:
-            if claude_path.exists():
-                content = claude_path.read_text().strip()
-                if content:
-                    # Size guard: truncate if over 500 lines
-                    lines = content.split('\n')
-                    if len(lines) > 500:
-                        content = '\n'.join(lines[:500])
-                        content += f"\n\n[... truncated, {len(lines) - 500} lines omitted]"
-                    prompt_parts.append(f"\n\n## Project Context (from {claude_path.name})")
-                    prompt_parts.append(content)
-                break
+            try:
+                f = open(claude_path, encoding="utf-8")
+            except OSError:
+                continue
+            with f:
+                # Size guard: stop reading at the 500-line cap instead of
+                # buffering an arbitrarily large file just to truncate it
+                lines = list(itertools.islice(f, 501))
+            truncated = len(lines) > 500
+            content = "".join(lines[:500]).strip()
+            if content:
+                if truncated:
+                    content += "\n\n[... truncated at 500 lines]"
+                prompt_parts.append(f"\n\n## Project Context (from {claude_path.name})")
+                prompt_parts.append(content)
+            break
 
     # 3. Context artifacts (from phase history)
     context_artifacts = task.get("context_artifacts", [])
@@ -2855,10 +3334,12 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
         for artifact_name in context_artifacts:
             if artifact_name in all_artifacts:
                 artifact_path = all_artifacts[artifact_name]
-                if artifact_path.exists():
-                    content = artifact_path.read_text().strip()
-                    if content:
-                        artifact_contents.append((artifact_name, artifact_path, content))
+                try:
+                    content = _read_bytes_fast(artifact_path).decode().strip()
+                except OSError:
+                    continue
+                if content:
+                    artifact_contents.append((artifact_name, artifact_path, content))
 
         if artifact_contents:
             prompt_parts.append("\n\n## Context Artifacts")
@@ -2872,15 +3353,21 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
     parent_outputs = []
     for parent_id in parents:
         parent_dir = get_task_output_dir(plan_dir, parent_id)
-        if parent_dir and parent_dir.is_dir():
-            # Look for output files (output.md, or any .md file)
-            output_files = list(parent_dir.glob("*.md"))
-            # Also check for progress.txt but skip it (that's internal)
-            for output_file in output_files:
-                if output_file.name != "progress.txt":
-                    content = output_file.read_text().strip()
+        if not parent_dir:
+            continue
+        # Look for output files (output.md, or any .md file); one scandir
+        # avoids glob's fnmatch pass and per-entry stats. progress.txt is
+        # internal and skipped.
+        try:
+            entries = os.scandir(parent_dir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and entry.is_file():
+                    content = _read_bytes_fast(Path(entry.path)).decode("utf-8").strip()
                     if content:
-                        parent_outputs.append((parent_id, output_file.name, content))
+                        parent_outputs.append((parent_id, entry.name, content))
 
     if parent_outputs:
         prompt_parts.append("\n\n## Parent Task Outputs")
@@ -2892,12 +3379,14 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
     task_dir = get_task_output_dir(plan_dir, args.task_id)
     if task_dir:
         progress_file = task_dir / "progress.txt"
-        if progress_file.exists():
-            progress_content = progress_file.read_text().strip()
-            if progress_content:
-                prompt_parts.append("\n\n## Prior Progress (Resuming)")
-                prompt_parts.append(progress_content)
-                prompt_parts.append("\nContinue from where the previous work left off.")
+        try:
+            progress_content = _read_bytes_fast(progress_file).decode().strip()
+        except OSError:
+            progress_content = ""
+        if progress_content:
+            prompt_parts.append("\n\n## Prior Progress (Resuming)")
+            prompt_parts.append(progress_content)
+            prompt_parts.append("\nContinue from where the previous work left off.")
 
     # 6. Progress logging (required for resumption)
     prompt_parts.append("\n\n## Progress Logging (Required)")
@@ -2928,7 +3417,7 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
     state = state_mgr.load()
     current_phase_id = state.get("current_phase")
     if current_phase_id:
-        artifacts_dir = Path(__file__).parent / "artifacts"
+        artifacts_dir = PLUGIN_ROOT / "artifacts"
         for artifact_spec in workflow_mgr.get_required_json_artifacts(current_phase_id):
             artifact_name = artifact_spec.get("name", "")
             if artifact_name:
@@ -2950,12 +3439,17 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
 
     # 10. Proposal injection (lessons learned from earlier tasks)
     proposal_manifest = plan_dir / "proposals-manifest.json"
-    if proposal_manifest.exists():
+    try:
+        manifest_bytes = _read_bytes_fast(proposal_manifest)
+    except OSError:
+        manifest_bytes = b""
+    # A missing or empty-object manifest holds no proposals; skip the parse
+    if manifest_bytes.strip() not in (b"", b"{}"):
         try:
-            manifest = json.loads(proposal_manifest.read_text())
+            manifest = json.loads(manifest_bytes)
             proposals = [
                 p for p in manifest.get("proposals", [])
-                if p.get("status") in ("pending", "accepted")
+                if p.get("status") in _ACTIVE_STATUSES
             ]
             if proposals:
                 prompt_parts.append("\n\n## Lessons Learned (from earlier tasks)")
@@ -2964,7 +3458,7 @@ def cmd_build_task_prompt(args: argparse.Namespace) -> int:
                     prompt_parts.append(f"\n- **{p.get('title', 'Untitled')}**")
                     if p.get("content"):
                         prompt_parts.append(f"  {p['content']}")
-        except (json.JSONDecodeError, OSError):
+        except json.JSONDecodeError:
             pass
 
     # 11. CLI reference for task completion
@@ -3009,9 +3503,8 @@ def cmd_get_execution_cmd(args: argparse.Namespace) -> int:
 
     if executor == "codex-cli":
         # Check if we're in a git repo
-        import subprocess as _sp
         try:
-            result = _sp.run(["git", "rev-parse", "--show-toplevel"],
+            result = subprocess.run(["git", "rev-parse", "--show-toplevel"],
                              capture_output=True, text=True, cwd=Path.cwd())
             in_git = result.returncode == 0
         except Exception:
@@ -3057,9 +3550,7 @@ def cmd_get_execution_cmd(args: argparse.Namespace) -> int:
 
 def cmd_help(args: argparse.Namespace) -> int:
     """Print concise CLI reference."""
-    # Get the actual plugin root path
-    plugin_root = Path(__file__).parent
-    cli_path = plugin_root / "plan.py"
+    cli_path = PLUGIN_ROOT / "plan.py"
 
     print(f"""## CLI Commands
 
@@ -3070,7 +3561,7 @@ def cmd_help(args: argparse.Namespace) -> int:
 **Next tasks:** `next-tasks` - available tasks to start
 **Progress:** `log <message>` | `recent-progress`
 
-Full docs: {plugin_root}/CLAUDE.md""")
+Full docs: {PLUGIN_ROOT}/CLAUDE.md""")
     return 0
 
 
@@ -3289,6 +3780,83 @@ def cmd_current_phase_dir(args: argparse.Namespace) -> int:
         return 1
 
 
+# Manifest field mappings for the enter-phase auto-import: per item kind,
+# the (field, default) pairs copied from artifact items into manifest records.
+_AUTO_IMPORT_FIELDS = {
+    "proposals": (
+        ("target_file", "CLAUDE.md"),
+        ("title", ""),
+        ("content", ""),
+        ("rationale", ""),
+    ),
+    "challenges": (
+        ("title", ""),
+        ("attempted", ""),
+        ("issue", ""),
+        ("workaround", ""),
+    ),
+}
+
+
+def _auto_import_items(
+    artifact_path: Path,
+    plan_dir: Path,
+    kind: str,
+    phase_dir_name: str,
+    pending: tuple[Path, dict, int] | None,
+) -> tuple[Path, dict, int] | None:
+    """Import one proposals/challenges artifact into its plan manifest.
+
+    Returns a (manifest_path, payload, imported) record for the caller's
+    deferred-write dict, or the unchanged ``pending`` record when the
+    artifact contributed nothing new. ``pending`` carries an earlier spec's
+    in-memory payload so repeated specs of the same kind build on it
+    instead of re-reading the stale manifest file.
+    """
+    with open(artifact_path) as f:
+        data = json.load(f)
+    items = data.get(kind, [])
+    if not items:
+        return pending
+
+    manifest_file = plan_dir / f"{kind}-manifest.json"
+    existing: list[dict] = []
+    existing_ids: set = set()
+    if pending is not None:
+        existing = pending[1][kind]
+        existing_ids = {i.get("id") for i in existing}
+    elif manifest_file.exists():
+        try:
+            manifest_data = json.loads(_read_bytes_fast(manifest_file))
+            existing = manifest_data.get(kind, [])
+            existing_ids = {i.get("id") for i in existing}
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    imported = 0
+    fields = _AUTO_IMPORT_FIELDS[kind]
+    for item in items:
+        # Generate ID as phase:title-slug
+        item_id = f"{phase_dir_name}:{slugify(item.get('title', 'untitled'))}"
+        if item_id in existing_ids:
+            continue
+        record = {"id": item_id, "source_phase": f"phases/{phase_dir_name}"}
+        for field, default in fields:
+            record[field] = item.get(field, default)
+        record["status"] = "pending"
+        existing.append(record)
+        existing_ids.add(item_id)
+        imported += 1
+
+    if imported:
+        return (
+            manifest_file,
+            {kind: existing},
+            imported + (pending[2] if pending else 0),
+        )
+    return pending
+
+
 def cmd_enter_phase(args: argparse.Namespace) -> int:
     """Enter a new phase, creating numbered directory."""
     project_dir = get_project_dir()
@@ -3310,20 +3878,17 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
     state_mgr = StateManager(plan_dir)
     state = state_mgr.load()
 
+    # Artifacts recorded by the current phase, consulted by the
+    # required-artifacts check and the auto-import block below; reads the
+    # state mirror, so no phase_history lookup is needed
+    current_artifacts = StateManager.current_phase_artifacts(state)
+
     # Check required_artifacts for the current phase (if any) before allowing transition
     current_phase = state.get("current_phase")
     if current_phase:
         required_artifacts = workflow_mgr.get_required_artifacts(current_phase)
         if required_artifacts:
-            # Get artifacts recorded for the current phase entry
-            current_entry = None
-            for entry in reversed(state.get("phase_history", [])):
-                if entry.get("entry") == state.get("current_phase_entry"):
-                    current_entry = entry
-                    break
-
-            recorded = set((current_entry or {}).get("artifacts", {}).keys())
-            missing = [a for a in required_artifacts if a not in recorded]
+            missing = [a for a in required_artifacts if a not in current_artifacts]
 
             if missing:
                 print(
@@ -3343,18 +3908,34 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
         # Validate required_json_artifacts against their schemas
         required_json_artifacts = workflow_mgr.get_required_json_artifacts(current_phase)
         if required_json_artifacts:
+            specs = [
+                (spec.get("name", ""), spec.get("schema", ""))
+                for spec in required_json_artifacts
+            ]
+            specs = [(name, schema) for name, schema in specs if name and schema]
+
+            def _validate(spec: tuple[str, str]) -> tuple[str, list[str]]:
+                name, schema = spec
+                return name, validate_json_artifact(name, schema, plan_dir, state_mgr)
+
+            if len(specs) > 1:
+                # Each validation reads and parses its own artifact file, so
+                # overlap the I/O across a small pool; map preserves spec
+                # order, keeping error output deterministic. Imported here so
+                # the other subcommands skip concurrent.futures' import cost.
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=min(8, len(specs))) as pool:
+                    results = list(pool.map(_validate, specs))
+            else:
+                results = [_validate(spec) for spec in specs]
+
             all_validation_errors: list[str] = []
-            for artifact_spec in required_json_artifacts:
-                artifact_name = artifact_spec.get("name", "")
-                schema_name = artifact_spec.get("schema", "")
-                if artifact_name and schema_name:
-                    errors = validate_json_artifact(
-                        artifact_name, schema_name, plan_dir, state_mgr
+            for artifact_name, errors in results:
+                if errors:
+                    all_validation_errors.extend(
+                        [f"{artifact_name}: {e}" for e in errors]
                     )
-                    if errors:
-                        all_validation_errors.extend(
-                            [f"{artifact_name}: {e}" for e in errors]
-                        )
 
             if all_validation_errors:
                 print(
@@ -3364,7 +3945,7 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
                 for error in all_validation_errors:
                     print(f"  - {error}", file=sys.stderr)
                 # Print instructions for each failing artifact
-                artifacts_dir = Path(__file__).parent / "artifacts"
+                artifacts_dir = PLUGIN_ROOT / "artifacts"
                 failed_artifacts = set()
                 for error in all_validation_errors:
                     artifact_name = error.split(":")[0].strip()
@@ -3376,166 +3957,68 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
                         print(instructions_file.read_text().strip(), file=sys.stderr)
                 return 1
 
-            # Auto-import cache-candidates if present and validated
+            # Auto-import supported artifacts in a single pass over the
+            # specs, using the artifact mirror resolved above
+            # Deferred manifest writes: {kind: (path, payload, imported)}.
+            # Each manifest is written at most once after the loop, and not
+            # at all when nothing new was imported.
+            manifest_writes: dict[str, tuple[Path, dict, int]] = {}
             for artifact_spec in required_json_artifacts:
                 artifact_name = artifact_spec.get("name", "")
+                if artifact_name not in current_artifacts:
+                    continue
+                artifact_path = plan_dir / current_artifacts[artifact_name]
+
                 if artifact_name == "cache-candidates":
-                    # Find the artifact path
-                    current_entry_data = None
-                    for entry in reversed(state.get("phase_history", [])):
-                        if entry.get("entry") == state.get("current_phase_entry"):
-                            current_entry_data = entry
-                            break
-                    if current_entry_data:
-                        artifacts = current_entry_data.get("artifacts", {})
-                        if artifact_name in artifacts:
-                            artifact_path = plan_dir / artifacts[artifact_name]
-                            # Import cache entries
-                            try:
-                                with open(artifact_path) as f:
-                                    data = json.load(f)
-                                entries = data.get("entries", [])
-                                if entries:
-                                    cache = ResearchCache(project_dir)
-                                    imported = 0
-                                    for entry in entries:
-                                        query = entry.get("query", "")
-                                        findings_file = entry.get("findings_file", "")
-                                        if query and findings_file:
-                                            findings_path = plan_dir / findings_file
-                                            if findings_path.exists():
-                                                findings_content = findings_path.read_text()
-                                                cache.add(
-                                                    query=query,
-                                                    findings=findings_content,
-                                                    source_type=entry.get("source_type", "task_research"),
-                                                    source_url=entry.get("source_url"),
-                                                    plan_id=plan_dir.name,
-                                                    replace=True,
-                                                )
-                                                imported += 1
-                                    if imported:
-                                        print(f"Auto-imported {imported} cache entries from {artifact_name}")
-                            except Exception as e:
-                                print(f"Warning: Failed to auto-import cache entries: {e}", file=sys.stderr)
-
-            # Auto-import proposals if present and validated
-            for artifact_spec in required_json_artifacts:
-                artifact_name = artifact_spec.get("name", "")
-                if artifact_name == "proposals":
-                    # Find the artifact path
-                    current_entry_data = None
-                    for entry in reversed(state.get("phase_history", [])):
-                        if entry.get("entry") == state.get("current_phase_entry"):
-                            current_entry_data = entry
-                            break
-                    if current_entry_data:
-                        artifacts = current_entry_data.get("artifacts", {})
-                        if artifact_name in artifacts:
-                            artifact_path = plan_dir / artifacts[artifact_name]
-                            # Import proposals into manifest
-                            try:
-                                with open(artifact_path) as f:
-                                    data = json.load(f)
-                                proposals_list = data.get("proposals", [])
-                                if proposals_list:
-                                    # Load existing manifest
-                                    manifest_file = plan_dir / "proposals-manifest.json"
-                                    existing_proposals = []
-                                    existing_ids = set()
-                                    if manifest_file.exists():
-                                        try:
-                                            manifest_data = json.loads(manifest_file.read_text())
-                                            existing_proposals = manifest_data.get("proposals", [])
-                                            existing_ids = {p.get("id") for p in existing_proposals}
-                                        except (json.JSONDecodeError, KeyError):
-                                            pass
-
-                                    # Add new proposals
-                                    imported = 0
-                                    phase_dir_name = f"{state.get('current_phase_entry'):02d}-{current_phase}"
-                                    for p in proposals_list:
-                                        # Generate ID as phase:title-slug
-                                        proposal_id = f"{phase_dir_name}:{slugify(p.get('title', 'untitled'))}"
-                                        if proposal_id not in existing_ids:
-                                            proposal = {
-                                                "id": proposal_id,
-                                                "source_phase": f"phases/{phase_dir_name}",
-                                                "target_file": p.get("target_file", "CLAUDE.md"),
-                                                "title": p.get("title", ""),
-                                                "content": p.get("content", ""),
-                                                "rationale": p.get("rationale", ""),
-                                                "status": "pending",
+                    # Import cache entries
+                    try:
+                        with open(artifact_path) as f:
+                            data = json.load(f)
+                        entries = data.get("entries", [])
+                        if entries:
+                            # Collect everything first, then insert the batch
+                            # under one transaction via add_many rather than
+                            # paying a commit per entry
+                            to_add = []
+                            for entry in entries:
+                                query = entry.get("query", "")
+                                findings_file = entry.get("findings_file", "")
+                                if query and findings_file:
+                                    findings_path = plan_dir / findings_file
+                                    if findings_path.exists():
+                                        to_add.append(
+                                            {
+                                                "query": query,
+                                                "findings": findings_path.read_text(),
+                                                "source_type": entry.get("source_type", "task_research"),
+                                                "source_url": entry.get("source_url"),
+                                                "plan_id": plan_dir.name,
                                             }
-                                            existing_proposals.append(proposal)
-                                            existing_ids.add(proposal_id)
-                                            imported += 1
-
-                                    # Write updated manifest
-                                    manifest_file.write_text(json.dumps({"proposals": existing_proposals}, indent=2))
-                                    if imported:
-                                        print(f"Auto-collected {imported} proposals")
-                            except Exception as e:
-                                print(f"Warning: Failed to auto-import proposals: {e}", file=sys.stderr)
-
-            # Auto-import challenges if present and validated
-            for artifact_spec in required_json_artifacts:
-                artifact_name = artifact_spec.get("name", "")
-                if artifact_name == "challenges":
-                    # Find the artifact path
-                    current_entry_data = None
-                    for entry in reversed(state.get("phase_history", [])):
-                        if entry.get("entry") == state.get("current_phase_entry"):
-                            current_entry_data = entry
-                            break
-                    if current_entry_data:
-                        artifacts = current_entry_data.get("artifacts", {})
-                        if artifact_name in artifacts:
-                            artifact_path = plan_dir / artifacts[artifact_name]
-                            # Import challenges into manifest
-                            try:
-                                with open(artifact_path) as f:
-                                    data = json.load(f)
-                                challenges_list = data.get("challenges", [])
-                                if challenges_list:
-                                    # Load existing manifest
-                                    manifest_file = plan_dir / "challenges-manifest.json"
-                                    existing_challenges = []
-                                    existing_ids = set()
-                                    if manifest_file.exists():
-                                        try:
-                                            manifest_data = json.loads(manifest_file.read_text())
-                                            existing_challenges = manifest_data.get("challenges", [])
-                                            existing_ids = {c.get("id") for c in existing_challenges}
-                                        except (json.JSONDecodeError, KeyError):
-                                            pass
-
-                                    # Add new challenges
-                                    imported = 0
-                                    phase_dir_name = f"{state.get('current_phase_entry'):02d}-{current_phase}"
-                                    for c in challenges_list:
-                                        # Generate ID as phase:title-slug
-                                        challenge_id = f"{phase_dir_name}:{slugify(c.get('title', 'untitled'))}"
-                                        if challenge_id not in existing_ids:
-                                            challenge = {
-                                                "id": challenge_id,
-                                                "source_phase": f"phases/{phase_dir_name}",
-                                                "title": c.get("title", ""),
-                                                "attempted": c.get("attempted", ""),
-                                                "issue": c.get("issue", ""),
-                                                "workaround": c.get("workaround", ""),
-                                                "status": "pending",
-                                            }
-                                            existing_challenges.append(challenge)
-                                            existing_ids.add(challenge_id)
-                                            imported += 1
+                                        )
+                            if to_add:
+                                _get_research_cache(str(project_dir)).add_many(to_add, replace=True)
+                                print(f"Auto-imported {len(to_add)} cache entries from {artifact_name}")
+                    except Exception as e:
+                        print(f"Warning: Failed to auto-import cache entries: {e}", file=sys.stderr)
+
+                elif artifact_name in _AUTO_IMPORT_FIELDS:
+                    phase_dir_name = f"{state.get('current_phase_entry'):02d}-{current_phase}"
+                    try:
+                        result = _auto_import_items(
+                            artifact_path,
+                            plan_dir,
+                            artifact_name,
+                            phase_dir_name,
+                            manifest_writes.get(artifact_name),
+                        )
+                        if result is not None:
+                            manifest_writes[artifact_name] = result
+                    except Exception as e:
+                        print(f"Warning: Failed to auto-import {artifact_name}: {e}", file=sys.stderr)
 
-                                    # Write updated manifest
-                                    manifest_file.write_text(json.dumps({"challenges": existing_challenges}, indent=2))
-                                    if imported:
-                                        print(f"Auto-collected {imported} challenges")
-                            except Exception as e:
-                                print(f"Warning: Failed to auto-import challenges: {e}", file=sys.stderr)
+            for kind, (manifest_file, payload, imported) in manifest_writes.items():
+                _dump_json(manifest_file, payload)
+                print(f"Auto-collected {imported} {kind}")
 
     # Count existing entries for this phase (for re-entry detection)
     prev_entries = [
@@ -3619,10 +4102,14 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
     phase_dir = phases_dir / phase_dir_name
     phase_dir.mkdir(exist_ok=True)
 
-    # Generate reentry-context.md if this is a re-entry
+    # Generate reentry-context.md if this is a re-entry. Stream the sections
+    # into a buffered handle rather than growing one string with += per
+    # artifact line.
     if is_reentry:
         last_entry = prev_entries[-1]
-        reentry_content = f"""# Re-entry Context
+        reentry_file = phase_dir / "reentry-context.md"
+        with open(reentry_file, "w", encoding="utf-8", buffering=65536) as f:
+            f.write(f"""# Re-entry Context
 
 ## Previous Attempt
 - Entry: {last_entry['entry']}
@@ -3632,23 +4119,21 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
 - Outcome: {last_entry.get('outcome', 'N/A')}
 
 ## Artifacts from Previous Attempt
-"""
-        prev_artifacts = last_entry.get("artifacts", {})
-        if prev_artifacts:
-            for name, path in prev_artifacts.items():
-                reentry_content += f"- {name}: {path}\n"
-        else:
-            reentry_content += "(none)\n"
+""")
+            prev_artifacts = last_entry.get("artifacts", {})
+            if prev_artifacts:
+                f.writelines(
+                    f"- {name}: {path}\n" for name, path in prev_artifacts.items()
+                )
+            else:
+                f.write("(none)\n")
 
-        # Add the detailed re-entry context from the reason file
-        reentry_content += f"""
+            # Add the detailed re-entry context from the reason file
+            f.write(f"""
 ## Re-entry Analysis
 
 {reentry_reason_content}
-"""
-
-        reentry_file = phase_dir / "reentry-context.md"
-        reentry_file.write_text(reentry_content)
+""")
 
     # Seed tasks.json with required_tasks if configured
     required_tasks = workflow_mgr.get_required_tasks(args.phase_id)
@@ -3663,35 +4148,38 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
                 seeded_task.setdefault("parents", [])
                 seeded_task.setdefault("steps", [])
                 seeded_tasks.append(seeded_task)
-            tasks_file.write_text(json.dumps(seeded_tasks, indent=2))
+            _dump_json(tasks_file, seeded_tasks)
             print(f"Seeded {len(seeded_tasks)} required task(s) in tasks.json")
         else:
             # Re-entry: merge required tasks with existing tasks.json
             existing_tasks = []
             if tasks_file.exists():
                 try:
-                    data = json.loads(tasks_file.read_text())
+                    data = json.loads(_read_bytes_fast(tasks_file))
                     existing_tasks = data if isinstance(data, list) else data.get("tasks", [])
                 except (json.JSONDecodeError, KeyError):
                     pass
 
-            existing_ids = {t.get("id") for t in existing_tasks}
+            # Id-indexed view makes the merge one O(R+E) pass instead of
+            # rescanning existing_tasks per required task
+            existing_by_id = {t.get("id"): t for t in existing_tasks}
             added_count = 0
             warnings = []
 
             for req_task in required_tasks:
                 req_id = req_task.get("id")
-                if req_id not in existing_ids:
+                existing_task = existing_by_id.get(req_id)
+                if existing_task is None:
                     # Add missing required task
                     seeded_task = dict(req_task)
                     seeded_task.setdefault("status", "todo")
                     seeded_task.setdefault("parents", [])
                     seeded_task.setdefault("steps", [])
                     existing_tasks.append(seeded_task)
+                    existing_by_id[req_id] = seeded_task
                     added_count += 1
                 else:
                     # Check protected fields match
-                    existing_task = next(t for t in existing_tasks if t.get("id") == req_id)
                     protected_fields = ["prompt_file", "subagent", "model", "executor", "inject_phase_prompt"]
                     for field in protected_fields:
                         req_val = req_task.get(field)
@@ -3699,12 +4187,14 @@ def cmd_enter_phase(args: argparse.Namespace) -> int:
                         if req_val is not None and existing_val != req_val:
                             warnings.append(f"Task '{req_id}' has modified {field}: expected '{req_val}', got '{existing_val}'")
 
-            if added_count > 0 or warnings:
-                tasks_file.write_text(json.dumps(existing_tasks, indent=2))
-                if added_count > 0:
-                    print(f"Added {added_count} missing required task(s)")
-                for warn in warnings:
-                    print(f"Warning: {warn}", file=sys.stderr)
+            # The merge only ever appends, so the file content changed iff
+            # something was added; warnings alone don't warrant rewriting
+            # identical bytes
+            if added_count > 0:
+                _dump_json(tasks_file, existing_tasks)
+                print(f"Added {added_count} missing required task(s)")
+            for warn in warnings:
+                print(f"Warning: {warn}", file=sys.stderr)
 
     # Update state
     relative_phase_dir = f"phases/{phase_dir_name}"
@@ -3876,6 +4366,36 @@ def cmd_phase_history(args: argparse.Namespace) -> int:
     return 0
 
 
+def _prior_entry_outputs(entry: dict, plan_dir: Path) -> dict:
+    """Collect the task output listing for one prior phase entry."""
+    entry_dir = entry["dir"]
+    tasks_dir = plan_dir / entry_dir / "tasks"
+    task_outputs = []
+    # scandir's DirEntry caches the file type from readdir, so the is_dir/
+    # is_file checks below avoid a stat per entry; a failed scandir doubles
+    # as the missing-directory check
+    try:
+        with os.scandir(tasks_dir) as it:
+            task_entries = sorted(
+                (e for e in it if e.is_dir()), key=lambda e: e.name
+            )
+    except OSError:
+        task_entries = []
+    for task_entry in task_entries:
+        with os.scandir(task_entry.path) as it:
+            files = sorted(f.name for f in it if f.is_file())
+        if files:
+            task_outputs.append({
+                "task": task_entry.name,
+                "files": files
+            })
+    return {
+        "entry": entry.get("entry"),
+        "dir": entry_dir,
+        "task_outputs": task_outputs,
+    }
+
+
 def cmd_prior_phase_outputs(args: argparse.Namespace) -> int:
     """List task output directories from prior entries of the same phase type."""
     project_dir = get_project_dir()
@@ -3898,28 +4418,13 @@ def cmd_prior_phase_outputs(args: argparse.Namespace) -> int:
     history = state.get("phase_history", [])
     current_entry = state.get("current_phase_entry", 0)
 
-    prior_entries = []
-    for entry in history:
-        if entry.get("phase") == phase_type and entry.get("entry") != current_entry:
-            entry_num = entry.get("entry")
-            entry_dir = entry.get("dir")
-            if entry_dir:
-                tasks_dir = plan_dir / entry_dir / "tasks"
-                task_outputs = []
-                if tasks_dir.exists():
-                    for task_dir in sorted(tasks_dir.iterdir()):
-                        if task_dir.is_dir():
-                            files = [f.name for f in task_dir.iterdir() if f.is_file()]
-                            if files:
-                                task_outputs.append({
-                                    "task": task_dir.name,
-                                    "files": sorted(files)
-                                })
-                prior_entries.append({
-                    "entry": entry_num,
-                    "dir": entry_dir,
-                    "task_outputs": task_outputs
-                })
+    prior_entries = [
+        _prior_entry_outputs(entry, plan_dir)
+        for entry in history
+        if entry.get("phase") == phase_type
+        and entry.get("entry") != current_entry
+        and entry.get("dir")
+    ]
 
     if args.json:
         result = {
@@ -4098,12 +4603,13 @@ def cmd_loop_to_phase(args: argparse.Namespace) -> int:
         # Set pending approval
         current_entry = state.get("current_phase_entry", 0)
         reason = args.reason or f"Loopback: {current_phase} -> {target_phase}"
-        state_mgr.set_pending_approval(current_phase, target_phase, reason, current_entry)
-
-        # Set mode to awaiting-feedback
-        state = state_mgr.load()
-        state["session_mode"] = "awaiting-feedback"
-        state_mgr.save(state)
+        state_mgr.set_pending_approval(
+            current_phase,
+            target_phase,
+            reason,
+            current_entry,
+            session_mode="awaiting-feedback",
+        )
 
         log_progress(plan_dir, f"TRANSITION_PROPOSED: {current_phase} -> {target_phase}")
 
@@ -4136,8 +4642,8 @@ def cmd_loop_to_phase(args: argparse.Namespace) -> int:
         # Include task completion summary from current phase
         try:
             current_tasks = get_tasks(plan_dir)
-            done = sum(1 for t in current_tasks if t.get("status") == "done")
-            blocked = sum(1 for t in current_tasks if t.get("status") == "blocked")
+            counts = Counter(t.get("status") for t in current_tasks)
+            done, blocked = counts["done"], counts["blocked"]
             total = len(current_tasks)
             if total > 0:
                 reason_parts.append(f"Tasks in {current_phase}: {done}/{total} done, {blocked} blocked")
@@ -4207,12 +4713,13 @@ def cmd_propose_transition(args: argparse.Namespace) -> int:
     # Set pending approval
     current_entry = state.get("current_phase_entry", 0)
     reason = args.reason or f"Transition requested: {current_phase} -> {target_phase}"
-    state_mgr.set_pending_approval(current_phase, target_phase, reason, current_entry)
-
-    # Set mode to awaiting-feedback
-    state = state_mgr.load()
-    state["session_mode"] = "awaiting-feedback"
-    state_mgr.save(state)
+    state_mgr.set_pending_approval(
+        current_phase,
+        target_phase,
+        reason,
+        current_entry,
+        session_mode="awaiting-feedback",
+    )
 
     log_progress(plan_dir, f"TRANSITION_PROPOSED: {current_phase} -> {target_phase}")
 
@@ -4566,10 +5073,10 @@ def cmd_phase_context(args: argparse.Namespace) -> int:
         proposal_manifest = plan_dir / "proposals-manifest.json"
         if proposal_manifest.exists():
             try:
-                manifest = json.loads(proposal_manifest.read_text())
+                manifest = json.loads(_read_bytes_fast(proposal_manifest))
                 active_proposals = [
                     p for p in manifest.get("proposals", [])
-                    if p.get("status") in ("pending", "accepted")
+                    if p.get("status") in _ACTIVE_STATUSES
                 ]
                 if active_proposals:
                     proposals_for_json = active_proposals
@@ -4583,7 +5090,7 @@ def cmd_phase_context(args: argparse.Namespace) -> int:
             "terminal": phase.get("terminal", False),
             "requires_user_input": phase.get("requires_user_input", False),
             "use_tasks": use_tasks,
-            "task_schema": TASK_SCHEMA if use_tasks else None,
+            "task_schema": task_schema() if use_tasks else None,
             "assembled_prompts": assembled_prompts if assembled_prompts else None,
             "suggested_next": phase.get("suggested_next", []),
             "required_artifacts": required_artifacts if required_artifacts else None,
@@ -4691,10 +5198,10 @@ def cmd_phase_context(args: argparse.Namespace) -> int:
         proposal_manifest = plan_dir / "proposals-manifest.json"
         if proposal_manifest.exists():
             try:
-                manifest = json.loads(proposal_manifest.read_text())
+                manifest = json.loads(_read_bytes_fast(proposal_manifest))
                 proposals = [
                     p for p in manifest.get("proposals", [])
-                    if p.get("status") in ("pending", "accepted")
+                    if p.get("status") in _ACTIVE_STATUSES
                 ]
                 if proposals:
                     print("## Lessons Learned (from earlier tasks)")
@@ -4711,7 +5218,7 @@ def cmd_phase_context(args: argparse.Namespace) -> int:
 
         # Task schema (injected for phases with use_tasks=true)
         if workflow_mgr.uses_tasks(current_phase):
-            print(TASK_SCHEMA)
+            print(task_schema())
             print()
 
         # Assembled prompts based on workflow flags
@@ -4832,15 +5339,11 @@ def cmd_phase_summary(args: argparse.Namespace) -> int:
     if current_phase_dir:
         print(f"Dir: {plan_dir / current_phase_dir}")
 
-    # Show suggested next
-    suggested = phase.get("suggested_next", [])
-    if suggested:
-        next_labels = []
-        for item in suggested:
-            if isinstance(item, str):
-                next_labels.append(item)
-            elif isinstance(item, dict):
-                next_labels.append(item.get("phase", ""))
+    # Show suggested next (pre-normalized by the workflow manager)
+    next_labels = [
+        item["phase"] for item in workflow_mgr.get_suggested_next_full(current_phase)
+    ]
+    if next_labels:
         print(f"Next: {', '.join(next_labels)}")
 
     # Show user guidance (truncated for summary)
@@ -4937,14 +5440,14 @@ def cmd_phase_next_tasks(args: argparse.Namespace) -> int:
         print("No tasks in current phase")
         return 0
 
-    task_status = {t["id"]: t.get("status") for t in tasks}
+    done_ids = {t["id"] for t in tasks if t.get("status") == "done"}
+    locked = held_locks(tasks)
     next_tasks = []
     for task in tasks:
         if task.get("status") != "todo":
             continue
-        parents = task.get("parents", [])
-        if all(task_status.get(pid) == "done" for pid in parents):
-            if not has_lock_conflict(task, tasks):
+        if done_ids.issuperset(task.get("parents", ())):
+            if not locked.intersection(task.get("locks", ())):
                 next_tasks.append(task)
 
     if next_tasks:
@@ -5513,12 +6016,34 @@ def cmd_validate_json_artifact(args: argparse.Namespace) -> int:
 # --- Proposal Commands ---
 
 
+# slugify tables/patterns: ASCII input resolves in one C-level translate
+# pass (keep word chars, fold whitespace and dashes to '-', drop the rest);
+# non-ASCII falls back to the Unicode-aware regexes with the same semantics.
+_SLUG_KEEP = string.ascii_lowercase + string.digits + "_"
+_SLUG_TABLE = str.maketrans(
+    {
+        c: (c if c in _SLUG_KEEP else "-" if c in " \t\n\r\f\v-" else None)
+        for c in map(chr, range(128))
+    }
+)
+_SLUG_WORD_RE = re.compile(r"[^\w\s-]")
+_SLUG_DASH_RE = re.compile(r"[-\s]+")
+_SLUG_RUNS_RE = re.compile(r"-+")
+
+
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
-    """Convert text to slug format for IDs."""
-    import re
+    """Convert text to slug format for IDs, cached per distinct input.
+
+    Proposal and challenge ids re-slugify the same titles on every
+    re-import after a loopback; repeated inputs skip the string work.
+    """
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    if text.isascii():
+        text = _SLUG_RUNS_RE.sub("-", text.translate(_SLUG_TABLE))
+    else:
+        text = _SLUG_WORD_RE.sub("", text)
+        text = _SLUG_DASH_RE.sub("-", text)
     return text[:50]  # Limit length
 
 
@@ -5595,7 +6120,7 @@ def cmd_collect_proposals(args: argparse.Namespace) -> int:
     existing = {}
     if manifest_file.exists():
         try:
-            data = json.loads(manifest_file.read_text())
+            data = json.loads(_read_bytes_fast(manifest_file))
             existing = {p["id"]: p for p in data.get("proposals", [])}
         except (json.JSONDecodeError, KeyError):
             pass
@@ -5644,7 +6169,7 @@ def cmd_collect_proposals(args: argparse.Namespace) -> int:
 
     # Write manifest
     manifest = {"proposals": proposals}
-    manifest_file.write_text(json.dumps(manifest, indent=2))
+    _dump_json(manifest_file, manifest)
 
     new_count = sum(1 for p in proposals if p["id"] not in existing)
     print(f"Collected {len(proposals)} proposals ({new_count} new)")
@@ -5665,7 +6190,7 @@ def cmd_list_proposals(args: argparse.Namespace) -> int:
         return 0
 
     try:
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json.loads(_read_bytes_fast(manifest_file))
     except json.JSONDecodeError:
         print("Error: Invalid manifest file", file=sys.stderr)
         return 1
@@ -5717,7 +6242,7 @@ def cmd_update_proposal_status(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json.loads(_read_bytes_fast(manifest_file))
     except json.JSONDecodeError:
         print("Error: Invalid manifest file", file=sys.stderr)
         return 1
@@ -5734,7 +6259,7 @@ def cmd_update_proposal_status(args: argparse.Namespace) -> int:
         print(f"Proposal not found: {args.proposal_id}", file=sys.stderr)
         return 1
 
-    manifest_file.write_text(json.dumps(manifest, indent=2))
+    _dump_json(manifest_file, manifest)
     print(f"Updated: {args.proposal_id} -> {args.status}")
     return 0
 
@@ -5817,7 +6342,7 @@ def cmd_collect_challenges(args: argparse.Namespace) -> int:
     existing = {}
     if manifest_file.exists():
         try:
-            data = json.loads(manifest_file.read_text())
+            data = json.loads(_read_bytes_fast(manifest_file))
             existing = {c["id"]: c for c in data.get("challenges", [])}
         except (json.JSONDecodeError, KeyError):
             pass
@@ -5866,7 +6391,7 @@ def cmd_collect_challenges(args: argparse.Namespace) -> int:
 
     # Write manifest
     manifest = {"challenges": challenges}
-    manifest_file.write_text(json.dumps(manifest, indent=2))
+    _dump_json(manifest_file, manifest)
 
     new_count = sum(1 for c in challenges if c["id"] not in existing)
     print(f"Collected {len(challenges)} challenges ({new_count} new)")
@@ -5887,7 +6412,7 @@ def cmd_list_challenges(args: argparse.Namespace) -> int:
         return 0
 
     try:
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json.loads(_read_bytes_fast(manifest_file))
     except json.JSONDecodeError:
         print("Error: Invalid manifest file", file=sys.stderr)
         return 1
@@ -5938,7 +6463,7 @@ def cmd_acknowledge_challenge(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json.loads(_read_bytes_fast(manifest_file))
     except json.JSONDecodeError:
         print("Error: Invalid manifest file", file=sys.stderr)
         return 1
@@ -5955,7 +6480,7 @@ def cmd_acknowledge_challenge(args: argparse.Namespace) -> int:
         print(f"Challenge not found: {args.challenge_id}", file=sys.stderr)
         return 1
 
-    manifest_file.write_text(json.dumps(manifest, indent=2))
+    _dump_json(manifest_file, manifest)
     print(f"Acknowledged: {args.challenge_id}")
     return 0
 
@@ -5996,7 +6521,7 @@ def cmd_status(args: argparse.Namespace) -> int:
             state_file = plan_dir / "state.json"
             if state_file.exists():
                 try:
-                    state = json.loads(state_file.read_text())
+                    state = json.loads(_read_bytes_fast(state_file))
                     current_phase = state.get("current_phase")
                     if current_phase:
                         print(f"  Current phase: {current_phase}")
@@ -6338,7 +6863,6 @@ def cmd_expand_phase(args: argparse.Namespace) -> int:
     shutil.copy(workflow_file, backup_file)
 
     # Load and modify workflow
-    import tomllib
     with open(workflow_file, "rb") as f:
         workflow = tomllib.load(f)
 
@@ -6453,16 +6977,8 @@ def cmd_validate_workflow(args: argparse.Namespace) -> int:
         print("No workflow.toml found", file=sys.stderr)
         return 1
 
-    errors = []
-
-    # Run schema validation first (catches unknown fields)
-    errors.extend(workflow_mgr.validate_schema())
-
-    # Run phase reference validation
-    errors.extend(workflow_mgr.validate_phase_references())
-
-    # Run expandable validation
-    errors.extend(workflow_mgr.validate_expandable())
+    # Schema errors first (unknown fields), then references, then expandable
+    errors = workflow_mgr.validate_all()
 
     if errors:
         print("Validation errors:", file=sys.stderr)